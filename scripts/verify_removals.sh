@@ -27,9 +27,12 @@ log_error() {
 echo "🔍 OPNsense Config Faker - Python Elimination Verification"
 echo "=========================================================="
 
-# Check if we're in the right directory
-if [[ ! -f "Cargo.toml" ]]; then
-    log_error "Cargo.toml not found. Please run this script from the project root."
+# Resolve the project root once from the script's own location; every check
+# below is rooted at it rather than at the working directory
+PROJECT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+
+if [[ ! -f "$PROJECT_DIR/Cargo.toml" ]]; then
+    log_error "Cargo.toml not found in $PROJECT_DIR."
     exit 1
 fi
 
@@ -87,14 +90,15 @@ PHASE1_FILES=(
 PHASE1_REMOVED=0
 PHASE1_TOTAL=${#PHASE1_FILES[@]}
 
+# Per-path checks only report problems; each phase prints one count line
 for file in "${PHASE1_FILES[@]}"; do
-    if [[ -e "$file" ]]; then
+    if [[ -e "$PROJECT_DIR/$file" ]]; then
         log_error "$file still exists (should be removed)"
     else
-        log_success "$file removed"
-        ((PHASE1_REMOVED++))
+        PHASE1_REMOVED=$((PHASE1_REMOVED + 1))
     fi
 done
+log_info "$PHASE1_REMOVED/$PHASE1_TOTAL removed"
 
 # Phase 2: Python tooling files (should be removed)
 log_info "Checking Phase 2 files (Python tooling - should be removed):"
@@ -131,13 +135,13 @@ PHASE2_REMOVED=0
 PHASE2_TOTAL=${#PHASE2_FILES[@]}
 
 for file in "${PHASE2_FILES[@]}"; do
-    if [[ -e "$file" ]]; then
+    if [[ -e "$PROJECT_DIR/$file" ]]; then
         log_error "$file still exists (should be removed)"
     else
-        log_success "$file removed"
-        ((PHASE2_REMOVED++))
+        PHASE2_REMOVED=$((PHASE2_REMOVED + 1))
     fi
 done
+log_info "$PHASE2_REMOVED/$PHASE2_TOTAL removed"
 
 # Phase 3: Legacy Python implementation (should be removed)
 log_info "Checking Phase 3 files (Legacy Python implementation - should be removed):"
@@ -151,18 +155,27 @@ PHASE3_REMOVED=0
 PHASE3_TOTAL=${#PHASE3_FILES[@]}
 
 for file in "${PHASE3_FILES[@]}"; do
-    if [[ -e "$file" ]]; then
+    if [[ -e "$PROJECT_DIR/$file" ]]; then
         log_error "$file still exists (should be removed)"
     else
-        log_success "$file removed"
-        ((PHASE3_REMOVED++))
+        PHASE3_REMOVED=$((PHASE3_REMOVED + 1))
     fi
 done
+log_info "$PHASE3_REMOVED/$PHASE3_TOTAL removed"
+
+# Walk the tree once for both the Python file and configuration checks,
+# pruning .git and target instead of descending into them
+TREE_SCAN=$(find "$PROJECT_DIR" \( -path "$PROJECT_DIR/.git" -o -path "$PROJECT_DIR/target" \) -prune -o \
+    \( -name "*.py" -o -name "*.toml" -o -name "*.cfg" -o -name "*.ini" -o -name "*.yml" -o -name "*.yaml" \) \
+    -print 2>/dev/null || true)
+# Report paths relative to the root, and keep the root's own name out of the
+# pattern matches below
+TREE_SCAN=${TREE_SCAN//"$PROJECT_DIR/"/./}
 
 # Check for any remaining Python files
 log_info "Checking for any remaining Python files:"
 
-REMAINING_PY_FILES=$(find . -name "*.py" -not -path "./.git/*" -not -path "./target/*" 2>/dev/null || true)
+REMAINING_PY_FILES=$(grep -E '\.py$' <<<"$TREE_SCAN" || true)
 
 if [[ -n "$REMAINING_PY_FILES" ]]; then
     log_error "Found remaining Python files:"
@@ -174,7 +187,7 @@ fi
 # Check for Python-related configuration files
 log_info "Checking for Python configuration files:"
 
-PY_CONFIG_FILES=$(find . -name "*.toml" -o -name "*.cfg" -o -name "*.ini" -o -name "*.yml" -o -name "*.yaml" | grep -E "(pyproject|pytest|tox|ruff|black|flake8|mypy)" 2>/dev/null || true)
+PY_CONFIG_FILES=$(grep -vE '\.py$' <<<"$TREE_SCAN" | grep -E "(pyproject|pytest|tox|ruff|black|flake8|mypy)" || true)
 
 if [[ -n "$PY_CONFIG_FILES" ]]; then
     log_error "Found Python configuration files:"
@@ -194,7 +207,7 @@ RUST_FILES=(
 )
 
 for file in "${RUST_FILES[@]}"; do
-    if [[ -f "$file" ]]; then
+    if [[ -f "$PROJECT_DIR/$file" ]]; then
         log_success "$file exists"
     else
         log_error "$file missing"
@@ -202,7 +215,7 @@ for file in "${RUST_FILES[@]}"; do
 done
 
 # Check for cargo-deny configuration
-if [[ -f "deny.toml" ]]; then
+if [[ -f "$PROJECT_DIR/deny.toml" ]]; then
     log_success "cargo-deny configuration found"
 else
     log_error "cargo-deny configuration missing"
@@ -211,7 +224,7 @@ fi
 # Check for XSD schema file (should be preserved)
 log_info "Checking for XSD schema file:"
 
-if [[ -f "opnsense-config.xsd" ]]; then
+if [[ -f "$PROJECT_DIR/opnsense-config.xsd" ]]; then
     log_success "opnsense-config.xsd preserved (XML Schema Definition, not Python code)"
 else
     log_error "opnsense-config.xsd missing (needed for OPNsense schema reference)"
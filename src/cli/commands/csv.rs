@@ -5,7 +5,7 @@
 use crate::generator::vlan::generate_vlan_configurations;
 use crate::io::csv::write_csv;
 use console::style;
-use indicatif::{ProgressBar, ProgressStyle};
+use indicatif::ProgressBar;
 
 /// Execute the CSV generation command
 pub fn execute(args: CsvArgs) -> Result<()> {
@@ -27,12 +27,7 @@ pub fn execute(args: CsvArgs) -> Result<()> {
 
     // Set up progress indicator
     let pb = ProgressBar::new(args.count as u64);
-    pb.set_style(
-        ProgressStyle::default_bar()
-            .template("{spinner:.green} [{elapsed_precise}] [{bar:40.cyan/blue}] {pos}/{len} {msg}")
-            .unwrap()
-            .progress_chars("#>-"),
-    );
+    pb.set_style(super::bar_style().clone());
     pb.set_message("Generating VLAN configurations...");
 
     // Generate VLAN configurations
@@ -12,6 +12,7 @@
 use std::fs;
 use std::io::{self, Write};
 use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 
 /// Execute the generate command with global arguments
 pub fn execute_with_global(mut args: GenerateArgs, global: &GlobalArgs) -> Result<()> {
@@ -388,10 +389,8 @@ fn execute_xml_generation(args: &GenerateArgs, global: &GlobalArgs) -> Result<()
         println!("🔧 Generating OPNsense XML configuration...");
     }
 
-    // Create output directory if it doesn't exist
-    if !args.output_dir.exists() {
-        fs::create_dir_all(&args.output_dir)?;
-    }
+    // Create output directory; this is a no-op when it already exists
+    fs::create_dir_all(&args.output_dir)?;
 
     // Generate or load VLAN configurations
     let configs = if let Some(csv_file) = &args.csv_file {
@@ -531,32 +530,35 @@ fn execute_xml_generation(args: &GenerateArgs, global: &GlobalArgs) -> Result<()
         global.quiet,
     );
 
-    // Generate XML configurations
-    for (index, config) in configs.iter().enumerate() {
-        pb.set_message(format!("Processing VLAN {}", config.vlan_id));
-
-        // Generate XML for this configuration
-        let output_xml = template.apply_configuration(
-            config,
-            args.firewall_nr,
-            args.opt_counter + index as u16,
-        )?;
+    // Refuse existing outputs before writing any, so a conflict leaves the
+    // same files behind whether or not the writes run in parallel
+    let output_files: Vec<PathBuf> = configs
+        .iter()
+        .map(|config| vlan_xml_path(args, config))
+        .collect();
+    super::check_output_files(output_files.iter().map(PathBuf::as_path), args.force)?;
 
-        // Write output file
-        let output_file = args.output_dir.join(format!(
-            "firewall_{}_vlan_{}.xml",
-            args.firewall_nr, config.vlan_id
-        ));
+    // Generate XML configurations; every VLAN renders to its own file, so
+    // with the rayon feature the files are produced in parallel
+    #[cfg(feature = "rayon")]
+    {
+        use rayon::prelude::*;
 
-        if output_file.exists() && !args.force {
-            return Err(crate::model::ConfigError::config(format!(
-                "Output file '{}' already exists. Use --force to overwrite.",
-                output_file.display()
-            ))
-            .into());
-        }
+        configs
+            .par_iter()
+            .enumerate()
+            .try_for_each(|(index, config)| {
+                pb.set_message(format!("Processing VLAN {}", config.vlan_id));
+                write_vlan_xml_file(args, &template, index, config)?;
+                pb.inc(1);
+                Ok::<_, anyhow::Error>(())
+            })?;
+    }
 
-        fs::write(&output_file, output_xml)?;
+    #[cfg(not(feature = "rayon"))]
+    for (index, config) in configs.iter().enumerate() {
+        pb.set_message(format!("Processing VLAN {}", config.vlan_id));
+        write_vlan_xml_file(args, &template, index, config)?;
         pb.inc(1);
     }
 
@@ -579,6 +581,28 @@ fn execute_xml_generation(args: &GenerateArgs, global: &GlobalArgs) -> Result<()
     Ok(())
 }
 
+/// Render one VLAN through the base template and write it to its own file
+fn write_vlan_xml_file(
+    args: &GenerateArgs,
+    template: &XmlTemplate,
+    index: usize,
+    config: &crate::generator::vlan::VlanConfig,
+) -> Result<()> {
+    let output_xml =
+        template.apply_configuration(config, args.firewall_nr, args.opt_counter + index as u16)?;
+
+    super::write_output_file(&vlan_xml_path(args, config), &output_xml, args.force)?;
+    Ok(())
+}
+
+/// Output path of the XML file for one VLAN
+fn vlan_xml_path(args: &GenerateArgs, config: &crate::generator::vlan::VlanConfig) -> PathBuf {
+    args.output_dir.join(format!(
+        "firewall_{}_vlan_{}.xml",
+        args.firewall_nr, config.vlan_id
+    ))
+}
+
 /// Create a progress bar with consistent styling
 fn create_progress_bar(total: u64, message: &str, quiet: bool) -> ProgressBar {
     if quiet {
@@ -586,25 +610,27 @@ fn create_progress_bar(total: u64, message: &str, quiet: bool) -> ProgressBar {
     }
 
     let pb = ProgressBar::new(total);
-
-    // Check if we should disable progress bar for non-interactive terminals
-    if env::var("NO_COLOR").is_ok() || env::var("TERM").unwrap_or_default() == "dumb" {
-        pb.set_style(ProgressStyle::default_spinner().template("{msg}").unwrap());
-    } else {
-        pb.set_style(
-            ProgressStyle::default_bar()
-                .template(
-                    "{spinner:.green} [{elapsed_precise}] [{bar:40.cyan/blue}] {pos}/{len} {msg}",
-                )
-                .unwrap()
-                .progress_chars("#>-"),
-        );
-    }
-
+    pb.set_style(progress_style().clone());
     pb.set_message(message.to_string());
     pb
 }
 
+/// Shared progress bar style, built once on first use
+///
+/// A single generate run creates several progress bars; parsing the
+/// template for each of them is wasted work.
+fn progress_style() -> &'static ProgressStyle {
+    static STYLE: OnceLock<ProgressStyle> = OnceLock::new();
+    STYLE.get_or_init(|| {
+        // Check if we should disable progress bar for non-interactive terminals
+        if env::var("NO_COLOR").is_ok() || env::var("TERM").unwrap_or_default() == "dumb" {
+            ProgressStyle::default_spinner().template("{msg}").unwrap()
+        } else {
+            super::bar_style().clone()
+        }
+    })
+}
+
 /// Print summary for CSV generation
 fn print_csv_summary(configs: &[crate::generator::vlan::VlanConfig], output_file: &Path) {
     println!();
@@ -6,3 +6,107 @@
 pub mod generate;
 pub mod validate;
 pub mod xml;
+
+use crate::model::ConfigError;
+use indicatif::ProgressStyle;
+use std::fs::{self, OpenOptions};
+use std::io::{ErrorKind, Write};
+use std::path::Path;
+use std::sync::OnceLock;
+
+/// Standard progress bar style shared by every command, built once on first use
+pub(crate) fn bar_style() -> &'static ProgressStyle {
+    static STYLE: OnceLock<ProgressStyle> = OnceLock::new();
+    STYLE.get_or_init(|| {
+        ProgressStyle::default_bar()
+            .template("{spinner:.green} [{elapsed_precise}] [{bar:40.cyan/blue}] {pos}/{len} {msg}")
+            .unwrap()
+            .progress_chars("#>-")
+    })
+}
+
+/// Write a generated file, refusing to replace an existing one unless `force`
+///
+/// Without `force` the file is opened with `create_new`, so the existence
+/// check and the create are a single filesystem operation. A file whose
+/// write fails is removed again.
+pub(crate) fn write_output_file(path: &Path, contents: &str, force: bool) -> crate::Result<()> {
+    if force {
+        fs::write(path, contents)?;
+        return Ok(());
+    }
+
+    let mut file = match OpenOptions::new().write(true).create_new(true).open(path) {
+        Ok(file) => file,
+        Err(e) if e.kind() == ErrorKind::AlreadyExists => return Err(output_exists(path)),
+        Err(e) => return Err(e.into()),
+    };
+    if let Err(e) = file.write_all(contents.as_bytes()) {
+        // Remove the partial file, or every rerun would be refused as existing
+        drop(file);
+        let _ = fs::remove_file(path);
+        return Err(e.into());
+    }
+    Ok(())
+}
+
+/// Fail on the first of `paths` that already exists unless `force`
+///
+/// Lets a command that writes many files refuse up front, before any of
+/// them are written, instead of stopping part way through.
+pub(crate) fn check_output_files<'a>(
+    paths: impl IntoIterator<Item = &'a Path>,
+    force: bool,
+) -> crate::Result<()> {
+    if force {
+        return Ok(());
+    }
+
+    match paths.into_iter().find(|path| path.exists()) {
+        Some(path) => Err(output_exists(path)),
+        None => Ok(()),
+    }
+}
+
+/// Error for an output file that `--force` would have replaced
+fn output_exists(path: &Path) -> ConfigError {
+    ConfigError::config(format!(
+        "Output file '{}' already exists. Use --force to overwrite.",
+        path.display()
+    ))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use tempfile::TempDir;
+
+    #[test]
+    fn test_write_output_file_respects_force() {
+        let temp_dir = TempDir::new().unwrap();
+        let path = temp_dir.path().join("out.xml");
+
+        write_output_file(&path, "first", false).unwrap();
+        let err = write_output_file(&path, "second", false).unwrap_err();
+        assert!(err.to_string().contains("already exists"));
+        assert_eq!(fs::read_to_string(&path).unwrap(), "first");
+
+        write_output_file(&path, "third", true).unwrap();
+        assert_eq!(fs::read_to_string(&path).unwrap(), "third");
+    }
+
+    #[test]
+    fn test_check_output_files_reports_first_conflict() {
+        let temp_dir = TempDir::new().unwrap();
+        let paths: Vec<_> = ["a.xml", "b.xml", "c.xml"]
+            .iter()
+            .map(|name| temp_dir.path().join(name))
+            .collect();
+        fs::write(&paths[1], "existing").unwrap();
+        fs::write(&paths[2], "existing").unwrap();
+
+        let err = check_output_files(paths.iter().map(|path| path.as_path()), false).unwrap_err();
+        assert!(err.to_string().contains("b.xml"));
+        assert!(check_output_files(paths.iter().map(|path| path.as_path()), true).is_ok());
+    }
+}
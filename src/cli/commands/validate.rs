@@ -10,6 +10,7 @@
 use indicatif::{ProgressBar, ProgressStyle};
 use std::env;
 use std::fs;
+use std::io::BufReader;
 use std::path::Path;
 
 /// Execute validation with global arguments
@@ -75,8 +76,9 @@ fn validate_csv(args: &ValidateArgs, global: &GlobalArgs) -> Result<()> {
         ProgressBar::hidden()
     };
 
-    let mut valid_configs = Vec::new();
-    for (index, config) in configs.iter().enumerate() {
+    // At most every configuration is valid, and each is moved rather than cloned
+    let mut valid_configs = Vec::with_capacity(configs.len());
+    for (index, config) in configs.into_iter().enumerate() {
         if error_count >= args.max_errors {
             if !global.quiet {
                 println!(
@@ -87,13 +89,13 @@ fn validate_csv(args: &ValidateArgs, global: &GlobalArgs) -> Result<()> {
             break;
         }
 
-        if let Err(e) = engine.validate_config(config) {
+        if let Err(e) = engine.validate_config(&config) {
             error_count += 1;
             if args.verbose || !global.quiet {
                 eprintln!("❌ Error in configuration {}: {}", index + 1, e);
             }
         } else {
-            valid_configs.push(config.clone());
+            valid_configs.push(config);
         }
 
         pb.inc(1);
@@ -135,16 +137,16 @@ fn validate_xml(args: &ValidateArgs, global: &GlobalArgs) -> Result<()> {
         println!("📝 This feature will validate OPNsense XML configuration files");
     }
 
-    // For now, just verify the file is valid XML
-    let content = fs::read_to_string(&args.input)?;
-
-    let mut reader = quick_xml::Reader::from_str(&content);
+    // For now, just verify the file is valid XML, streaming it through a
+    // reused event buffer so large files are never held in memory at once
+    let file = fs::File::open(&args.input)?;
+    let mut reader = quick_xml::Reader::from_reader(BufReader::new(file));
     let mut buf = Vec::new();
 
     loop {
         match reader.read_event_into(&mut buf) {
             Ok(quick_xml::events::Event::Eof) => break,
-            Ok(_) => continue,
+            Ok(_) => {}
             Err(e) => {
                 eprintln!("❌ Invalid XML: {}", e);
                 return Err(
@@ -152,6 +154,7 @@ fn validate_xml(args: &ValidateArgs, global: &GlobalArgs) -> Result<()> {
                 );
             }
         }
+        buf.clear();
     }
 
     if !global.quiet {
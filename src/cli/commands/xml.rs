@@ -6,8 +6,9 @@
 use crate::io::csv::read_csv;
 use crate::xml::template::XmlTemplate;
 use console::style;
-use indicatif::{ProgressBar, ProgressStyle};
+use indicatif::ProgressBar;
 use std::fs;
+use std::io::ErrorKind;
 
 /// Execute the XML generation command
 pub fn execute(args: XmlArgs) -> Result<()> {
@@ -19,17 +20,20 @@ pub fn execute(args: XmlArgs) -> Result<()> {
     );
     println!();
 
-    // Validate base configuration file exists
-    if !args.base_config.exists() {
-        return Err(crate::model::ConfigError::ConfigNotFound {
-            path: args.base_config.display().to_string(),
-        });
-    }
+    // Load the base configuration up front; a missing file surfaces from the
+    // read itself rather than from a separate existence check
+    let base_xml = match fs::read_to_string(&args.base_config) {
+        Ok(content) => content,
+        Err(e) if e.kind() == ErrorKind::NotFound => {
+            return Err(crate::model::ConfigError::ConfigNotFound {
+                path: args.base_config.display().to_string(),
+            });
+        }
+        Err(e) => return Err(e.into()),
+    };
 
-    // Create output directory if it doesn't exist
-    if !args.output_dir.exists() {
-        fs::create_dir_all(&args.output_dir)?;
-    }
+    // Create output directory; this is a no-op when it already exists
+    fs::create_dir_all(&args.output_dir)?;
 
     // Generate or load VLAN configurations
     let configs = if let Some(csv_file) = &args.csv_file {
@@ -39,14 +43,7 @@ pub fn execute(args: XmlArgs) -> Result<()> {
         println!("🔄 Generating {count} VLAN configurations...");
 
         let pb = ProgressBar::new(count as u64);
-        pb.set_style(
-            ProgressStyle::default_bar()
-                .template(
-                    "{spinner:.green} [{elapsed_precise}] [{bar:40.cyan/blue}] {pos}/{len} {msg}",
-                )
-                .unwrap()
-                .progress_chars("#>-"),
-        );
+        pb.set_style(super::bar_style().clone());
         pb.set_message("Generating configurations...");
 
         let configs = generate_vlan_configurations(count, args.seed, Some(&pb))?;
@@ -61,18 +58,12 @@ pub fn execute(args: XmlArgs) -> Result<()> {
 
     println!("📝 Processing {} configurations...", configs.len());
 
-    // Load base XML template
-    let base_xml = fs::read_to_string(&args.base_config)?;
+    // Build the template from the base configuration read above
     let template = XmlTemplate::new(base_xml)?;
 
     // Set up progress for XML generation
     let pb = ProgressBar::new(configs.len() as u64);
-    pb.set_style(
-        ProgressStyle::default_bar()
-            .template("{spinner:.green} [{elapsed_precise}] [{bar:40.cyan/blue}] {pos}/{len} {msg}")
-            .unwrap()
-            .progress_chars("#>-"),
-    );
+    pb.set_style(super::bar_style().clone());
     pb.set_message("Generating XML configurations...");
 
     // Generate XML configurations
@@ -92,14 +83,7 @@ pub fn execute(args: XmlArgs) -> Result<()> {
             args.firewall_nr, config.vlan_id
         ));
 
-        if output_file.exists() && !args.force {
-            return Err(crate::model::ConfigError::config(format!(
-                "Output file '{}' already exists. Use --force to overwrite.",
-                output_file.display()
-            )));
-        }
-
-        fs::write(&output_file, output_xml)?;
+        super::write_output_file(&output_file, &output_xml, args.force)?;
         pb.inc(1);
     }
 
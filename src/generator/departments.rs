@@ -29,6 +29,22 @@ pub fn random_department<R: rand::Rng>(rng: &mut R) -> &'static str {
     DEPARTMENTS[rng.random_range(0..DEPARTMENTS.len())]
 }
 
+/// Separator between the department name and the VLAN ID in descriptions
+const VLAN_DESCRIPTION_SEPARATOR: &str = " VLAN ";
+
+/// Build the "<department> VLAN <id>" description in one exact-size allocation
+pub fn vlan_description(department: &str, vlan_id: u16) -> String {
+    use std::fmt::Write;
+
+    // A u16 has at most five digits
+    let mut description =
+        String::with_capacity(department.len() + VLAN_DESCRIPTION_SEPARATOR.len() + 5);
+    description.push_str(department);
+    description.push_str(VLAN_DESCRIPTION_SEPARATOR);
+    write!(description, "{vlan_id}").expect("Writing to a String cannot fail");
+    description
+}
+
 /// Get the number of available departments
 pub fn department_count() -> usize {
     DEPARTMENTS.len()
@@ -63,6 +79,14 @@ fn test_department_count() {
         assert!(department_count() > 0);
     }
 
+    #[test]
+    fn test_vlan_description_matches_format() {
+        for (department, vlan_id) in [("IT", 10), ("Customer Service", 4094), ("QA", 0)] {
+            let description = vlan_description(department, vlan_id);
+            assert_eq!(description, format!("{department} VLAN {vlan_id}"));
+        }
+    }
+
     #[test]
     fn test_all_departments() {
         let all = all_departments();
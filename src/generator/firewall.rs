@@ -2,12 +2,29 @@
 
 use crate::Result;
 use crate::model::ConfigError;
-use fake::Fake;
+use fake::locales::{Data, EN};
 use indicatif::ProgressBar;
 use rand::prelude::*;
 use rand_chacha::ChaCha8Rng;
 use serde::{Deserialize, Serialize};
 use std::collections::HashSet;
+use std::sync::OnceLock;
+
+/// Accepted rule actions (matched case-insensitively)
+pub(crate) const VALID_ACTIONS: &[&str] = &["pass", "block", "reject"];
+
+/// Accepted rule directions (matched case-insensitively)
+pub(crate) const VALID_DIRECTIONS: &[&str] = &["in", "out"];
+
+/// Accepted rule protocols (matched case-insensitively)
+pub(crate) const VALID_PROTOCOLS: &[&str] = &["tcp", "udp", "icmp", "any"];
+
+/// Case-insensitive membership test against one of the accepted value lists
+pub(crate) fn is_one_of(value: &str, accepted: &[&str]) -> bool {
+    accepted
+        .iter()
+        .any(|candidate| candidate.eq_ignore_ascii_case(value))
+}
 
 /// Firewall rule configuration structure
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq)]
@@ -66,35 +83,70 @@ pub fn new(
         priority: u16,
         interface: String,
     ) -> Result<Self> {
+        Self::check_fields(&rule_id, &protocol, &action, &direction, vlan_id)?;
+
+        Ok(Self {
+            rule_id,
+            source,
+            destination,
+            protocol,
+            ports,
+            action,
+            direction,
+            description,
+            log,
+            vlan_id,
+            priority,
+            interface,
+        })
+    }
+
+    /// Validate the firewall rule configuration
+    pub fn validate(&self) -> Result<()> {
+        // Re-run validation logic on the borrowed fields
+        Self::check_fields(
+            &self.rule_id,
+            &self.protocol,
+            &self.action,
+            &self.direction,
+            self.vlan_id,
+        )
+    }
+
+    /// Field checks shared by construction and validation
+    fn check_fields(
+        rule_id: &str,
+        protocol: &str,
+        action: &str,
+        direction: &str,
+        vlan_id: Option<u16>,
+    ) -> Result<()> {
         // Validate rule ID
         if rule_id.is_empty() {
             return Err(ConfigError::validation("Rule ID cannot be empty"));
         }
 
         // Validate action
-        let valid_actions = ["pass", "block", "reject"];
-        if !valid_actions.contains(&action.to_lowercase().as_str()) {
+        if !is_one_of(action, VALID_ACTIONS) {
             return Err(ConfigError::validation(format!(
                 "Invalid action '{}'. Must be one of: {:?}",
-                action, valid_actions
+                action, VALID_ACTIONS
             )));
         }
 
         // Validate direction
-        let valid_directions = ["in", "out"];
-        if !valid_directions.contains(&direction.to_lowercase().as_str()) {
+        if !is_one_of(direction, VALID_DIRECTIONS) {
             return Err(ConfigError::validation(format!(
                 "Invalid direction '{}'. Must be one of: {:?}",
-                direction, valid_directions
+                direction, VALID_DIRECTIONS
             )));
         }
 
         // Validate protocol
-        let valid_protocols = ["tcp", "udp", "icmp", "any"];
-        if !valid_protocols.contains(&protocol.to_lowercase().as_str()) {
+        if !is_one_of(protocol, VALID_PROTOCOLS) {
             return Err(ConfigError::validation(format!(
                 "Invalid protocol '{}'. Must be one of: {:?}",
-                protocol, valid_protocols
+                protocol, VALID_PROTOCOLS
             )));
         }
 
@@ -108,39 +160,6 @@ pub fn new(
             )));
         }
 
-        Ok(Self {
-            rule_id,
-            source,
-            destination,
-            protocol,
-            ports,
-            action,
-            direction,
-            description,
-            log,
-            vlan_id,
-            priority,
-            interface,
-        })
-    }
-
-    /// Validate the firewall rule configuration
-    pub fn validate(&self) -> Result<()> {
-        // Re-run validation logic
-        let _ = Self::new(
-            self.rule_id.clone(),
-            self.source.clone(),
-            self.destination.clone(),
-            self.protocol.clone(),
-            self.ports.clone(),
-            self.action.clone(),
-            self.direction.clone(),
-            self.description.clone(),
-            self.log,
-            self.vlan_id,
-            self.priority,
-            self.interface.clone(),
-        )?;
         Ok(())
     }
 }
@@ -168,10 +187,17 @@ impl std::str::FromStr for FirewallComplexity {
     type Err = ConfigError;
 
     fn from_str(s: &str) -> std::result::Result<Self, Self::Err> {
-        match s.to_lowercase().as_str() {
-            "basic" => Ok(FirewallComplexity::Basic),
-            "intermediate" => Ok(FirewallComplexity::Intermediate),
-            "advanced" => Ok(FirewallComplexity::Advanced),
+        // The first letter alone identifies each level; confirm the full name
+        // without lowercasing the input into a new String
+        let candidate = match s.as_bytes().first().map(u8::to_ascii_lowercase) {
+            Some(b'b') => Some((FirewallComplexity::Basic, "basic")),
+            Some(b'i') => Some((FirewallComplexity::Intermediate, "intermediate")),
+            Some(b'a') => Some((FirewallComplexity::Advanced, "advanced")),
+            _ => None,
+        };
+
+        match candidate {
+            Some((level, name)) if s.eq_ignore_ascii_case(name) => Ok(level),
             _ => Err(ConfigError::validation(format!(
                 "Invalid complexity level '{}'. Must be one of: basic, intermediate, advanced",
                 s
@@ -190,7 +216,7 @@ pub struct FirewallGenerator {
     #[allow(dead_code)]
     rng: ChaCha8Rng,
     rule_counter: u16,
-    used_rule_ids: HashSet<String>,
+    used_rule_ids: HashSet<u16>,
 }
 
 impl FirewallGenerator {
@@ -220,18 +246,19 @@ pub fn generate_vlan_rules(
         let default_rules_count = complexity.rules_per_vlan();
         let rules_count = firewall_rules_per_vlan.unwrap_or(default_rules_count);
         let mut rules = Vec::with_capacity(rules_count as usize);
+        let scope = VlanRuleScope::new(vlan_id, vlan_network, department);
 
         // Generate basic network access rules
-        rules.extend(self.generate_basic_rules(vlan_id, vlan_network, department)?);
+        rules.extend(self.generate_basic_rules(&scope)?);
 
         // Generate intermediate rules if complexity allows
         if complexity >= FirewallComplexity::Intermediate {
-            rules.extend(self.generate_intermediate_rules(vlan_id, vlan_network, department)?);
+            rules.extend(self.generate_intermediate_rules(&scope)?);
         }
 
         // Generate advanced rules if complexity allows
         if complexity >= FirewallComplexity::Advanced {
-            rules.extend(self.generate_advanced_rules(vlan_id, vlan_network, department)?);
+            rules.extend(self.generate_advanced_rules(&scope)?);
         }
 
         // Ensure we don't exceed the requested count
@@ -246,60 +273,37 @@ pub fn generate_vlan_rules(
     }
 
     /// Generate basic firewall rules (always included)
-    fn generate_basic_rules(
-        &mut self,
-        vlan_id: u16,
-        vlan_network: &str,
-        department: &str,
-    ) -> Result<Vec<FirewallRule>> {
+    fn generate_basic_rules(&mut self, scope: &VlanRuleScope<'_>) -> Result<Vec<FirewallRule>> {
         let mut rules = Vec::with_capacity(3);
 
         // Rule 1: Allow internal traffic within VLAN
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "any".to_string(),
-            "pass".to_string(),
-            "in".to_string(),
-            generate_rule_description(&mut self.rng, department, "Allow", "internal traffic"),
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, scope.network),
+            ("any", "any"),
+            ("pass", "in"),
+            ("Allow", "internal traffic"),
             true,
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         // Rule 2: Allow DNS queries
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "udp".to_string(),
-            "53".to_string(),
-            "pass".to_string(),
-            "out".to_string(),
-            generate_rule_description(&mut self.rng, department, "Allow", "DNS queries"),
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, "any"),
+            ("udp", "53"),
+            ("pass", "out"),
+            ("Allow", "DNS queries"),
             true,
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         // Rule 3: Allow HTTP/HTTPS for internet access
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "tcp".to_string(),
-            "80,443".to_string(),
-            "pass".to_string(),
-            "out".to_string(),
-            generate_rule_description(&mut self.rng, department, "Allow", "web access"),
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, "any"),
+            ("tcp", "80,443"),
+            ("pass", "out"),
+            ("Allow", "web access"),
             true,
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         Ok(rules)
@@ -308,263 +312,202 @@ fn generate_basic_rules(
     /// Generate intermediate firewall rules
     fn generate_intermediate_rules(
         &mut self,
-        vlan_id: u16,
-        vlan_network: &str,
-        department: &str,
+        scope: &VlanRuleScope<'_>,
     ) -> Result<Vec<FirewallRule>> {
-        let dept_lower = department.to_lowercase();
         let mut rules = Vec::with_capacity(4);
 
         // Rule 4: Allow NTP time synchronization
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "udp".to_string(),
-            "123".to_string(),
-            "pass".to_string(),
-            "out".to_string(),
-            generate_rule_description(&mut self.rng, department, "Allow", "NTP synchronization"),
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, "any"),
+            ("udp", "123"),
+            ("pass", "out"),
+            ("Allow", "NTP synchronization"),
             false, // Don't log NTP traffic
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         // Rule 5: Allow ICMP for network diagnostics
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "icmp".to_string(),
-            "any".to_string(),
-            "pass".to_string(),
-            "out".to_string(),
-            generate_rule_description(&mut self.rng, department, "Allow", "ICMP diagnostics"),
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, "any"),
+            ("icmp", "any"),
+            ("pass", "out"),
+            ("Allow", "ICMP diagnostics"),
             false, // Don't log ICMP traffic
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         // Rule 6: Block common attack ports
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            "any".to_string(),
-            vlan_network.to_string(),
-            "tcp".to_string(),
-            "22,23,3389".to_string(), // SSH, Telnet, RDP
-            "block".to_string(),
-            "in".to_string(),
-            generate_rule_description(&mut self.rng, department, "Block", "remote access attempts"),
+        rules.push(self.scoped_rule(
+            scope,
+            ("any", scope.network),
+            ("tcp", "22,23,3389"), // SSH, Telnet, RDP
+            ("block", "in"),
+            ("Block", "remote access attempts"),
             true,
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         // Rule 7: Allow specific application ports based on department
-        let app_ports = self.get_department_ports(&dept_lower);
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "tcp".to_string(),
-            app_ports,
-            "pass".to_string(),
-            "out".to_string(),
-            generate_rule_description(&mut self.rng, department, "Allow", "application access"),
+        let app_ports = self.get_department_ports(&scope.dept_lower);
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, "any"),
+            ("tcp", app_ports),
+            ("pass", "out"),
+            ("Allow", "application access"),
             true,
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         Ok(rules)
     }
 
     /// Generate advanced firewall rules
-    fn generate_advanced_rules(
-        &mut self,
-        vlan_id: u16,
-        vlan_network: &str,
-        department: &str,
-    ) -> Result<Vec<FirewallRule>> {
-        let dept_lower = department.to_lowercase();
+    fn generate_advanced_rules(&mut self, scope: &VlanRuleScope<'_>) -> Result<Vec<FirewallRule>> {
         let mut rules = Vec::with_capacity(8);
 
         // Rule 8: Rate limiting for web traffic
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "tcp".to_string(),
-            "80,443".to_string(),
-            "pass".to_string(),
-            "out".to_string(),
-            generate_rule_description(&mut self.rng, department, "Rate-limited", "web access"),
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, "any"),
+            ("tcp", "80,443"),
+            ("pass", "out"),
+            ("Rate-limited", "web access"),
             true,
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         // Rule 9: Block peer-to-peer traffic
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "tcp".to_string(),
-            "6881:6889,51413".to_string(), // BitTorrent ports
-            "block".to_string(),
-            "out".to_string(),
-            generate_rule_description(&mut self.rng, department, "Block", "P2P traffic"),
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, "any"),
+            ("tcp", "6881:6889,51413"), // BitTorrent ports
+            ("block", "out"),
+            ("Block", "P2P traffic"),
             true,
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         // Rule 10: Allow VPN access for specific departments
-        if self.should_allow_vpn(&dept_lower) {
-            rules.push(FirewallRule::new(
-                self.generate_rule_id(),
-                vlan_network.to_string(),
-                "any".to_string(),
-                "udp".to_string(),
-                "1194,500,4500".to_string(), // OpenVPN, IPSec
-                "pass".to_string(),
-                "out".to_string(),
-                generate_rule_description(&mut self.rng, department, "Allow", "VPN access"),
+        if self.should_allow_vpn(&scope.dept_lower) {
+            rules.push(self.scoped_rule(
+                scope,
+                (scope.network, "any"),
+                ("udp", "1194,500,4500"), // OpenVPN, IPSec
+                ("pass", "out"),
+                ("Allow", "VPN access"),
                 true,
-                Some(vlan_id),
-                0, // Will be set later
-                format!("vlan{}", vlan_id),
             )?);
         }
 
         // Rule 11: Block social media for certain departments
-        if self.should_block_social_media(&dept_lower) {
-            rules.push(FirewallRule::new(
-                self.generate_rule_id(),
-                vlan_network.to_string(),
-                "any".to_string(),
-                "tcp".to_string(),
-                "443".to_string(),
-                "block".to_string(),
-                "out".to_string(),
-                generate_rule_description(
-                    &mut self.rng,
-                    department,
-                    "Block",
-                    "social media access",
-                ),
+        if self.should_block_social_media(&scope.dept_lower) {
+            rules.push(self.scoped_rule(
+                scope,
+                (scope.network, "any"),
+                ("tcp", "443"),
+                ("block", "out"),
+                ("Block", "social media access"),
                 true,
-                Some(vlan_id),
-                0, // Will be set later
-                format!("vlan{}", vlan_id),
             )?);
         }
 
         // Rule 12: Allow file sharing for IT department
-        if dept_lower.contains("it") {
-            rules.push(FirewallRule::new(
-                self.generate_rule_id(),
-                vlan_network.to_string(),
-                "any".to_string(),
-                "tcp".to_string(),
-                "21,22,445,139".to_string(), // FTP, SSH, SMB
-                "pass".to_string(),
-                "out".to_string(),
-                generate_rule_description(&mut self.rng, department, "Allow", "file sharing"),
+        if scope.dept_lower.contains("it") {
+            rules.push(self.scoped_rule(
+                scope,
+                (scope.network, "any"),
+                ("tcp", "21,22,445,139"), // FTP, SSH, SMB
+                ("pass", "out"),
+                ("Allow", "file sharing"),
                 true,
-                Some(vlan_id),
-                0, // Will be set later
-                format!("vlan{}", vlan_id),
             )?);
         }
 
         // Rule 13: Block gaming traffic for business departments
-        if self.should_block_gaming(&dept_lower) {
-            rules.push(FirewallRule::new(
-                self.generate_rule_id(),
-                vlan_network.to_string(),
-                "any".to_string(),
-                "tcp".to_string(),
-                "27015:27018,25565,25575".to_string(), // Common gaming ports
-                "block".to_string(),
-                "out".to_string(),
-                generate_rule_description(&mut self.rng, department, "Block", "gaming traffic"),
+        if self.should_block_gaming(&scope.dept_lower) {
+            rules.push(self.scoped_rule(
+                scope,
+                (scope.network, "any"),
+                ("tcp", "27015:27018,25565,25575"), // Common gaming ports
+                ("block", "out"),
+                ("Block", "gaming traffic"),
                 true,
-                Some(vlan_id),
-                0, // Will be set later
-                format!("vlan{}", vlan_id),
             )?);
         }
 
         // Rule 14: Allow monitoring and management traffic
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "tcp".to_string(),
-            "161,162,514".to_string(), // SNMP, Syslog
-            "pass".to_string(),
-            "out".to_string(),
-            generate_rule_description(&mut self.rng, department, "Allow", "monitoring traffic"),
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, "any"),
+            ("tcp", "161,162,514"), // SNMP, Syslog
+            ("pass", "out"),
+            ("Allow", "monitoring traffic"),
             false, // Don't log monitoring traffic
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         // Rule 15: Default deny rule (should be last)
-        rules.push(FirewallRule::new(
-            self.generate_rule_id(),
-            vlan_network.to_string(),
-            "any".to_string(),
-            "any".to_string(),
-            "any".to_string(),
-            "block".to_string(),
-            "out".to_string(),
-            generate_rule_description(
-                &mut self.rng,
-                department,
-                "Default deny",
-                "outbound traffic",
-            ),
+        rules.push(self.scoped_rule(
+            scope,
+            (scope.network, "any"),
+            ("any", "any"),
+            ("block", "out"),
+            ("Default deny", "outbound traffic"),
             true,
-            Some(vlan_id),
-            0, // Will be set later
-            format!("vlan{}", vlan_id),
         )?);
 
         Ok(rules)
     }
 
+    /// Build one rule for the VLAN in `scope`
+    ///
+    /// Only the fields that differ between rules are passed in, as
+    /// `(source, destination)`, `(protocol, ports)`, `(action, direction)` and
+    /// the `(verb, service)` used for the description. The VLAN id and
+    /// interface come from the scope.
+    fn scoped_rule(
+        &mut self,
+        scope: &VlanRuleScope<'_>,
+        (source, destination): (&str, &str),
+        (protocol, ports): (&str, &str),
+        (action, direction): (&str, &str),
+        (verb, service): (&str, &str),
+        log: bool,
+    ) -> Result<FirewallRule> {
+        FirewallRule::new(
+            self.generate_rule_id(),
+            source.to_string(),
+            destination.to_string(),
+            protocol.to_string(),
+            ports.to_string(),
+            action.to_string(),
+            direction.to_string(),
+            generate_rule_description(&mut self.rng, scope.department, verb, service),
+            log,
+            Some(scope.vlan_id),
+            0, // Assigned by generate_vlan_rules
+            scope.interface.clone(),
+        )
+    }
+
     /// Generate a unique rule ID
     fn generate_rule_id(&mut self) -> String {
         loop {
-            let rule_id = format!("rule_{:04}", self.rule_counter);
+            let counter = self.rule_counter;
             self.rule_counter += 1;
 
-            if !self.used_rule_ids.contains(&rule_id) {
-                self.used_rule_ids.insert(rule_id.clone());
-                return rule_id;
+            if self.used_rule_ids.insert(counter) {
+                return format!("rule_{counter:04}");
             }
         }
     }
 
     /// Get department-specific application ports
-    fn get_department_ports(&self, dept_lower: &str) -> String {
+    fn get_department_ports(&self, dept_lower: &str) -> &'static str {
         if dept_lower.contains("it") || dept_lower.contains("engineering") {
-            "22,23,3389,5900,8080,8443".to_string() // SSH, Telnet, RDP, VNC, Web management
+            "22,23,3389,5900,8080,8443" // SSH, Telnet, RDP, VNC, Web management
         } else if dept_lower.contains("sales") || dept_lower.contains("marketing") {
-            "25,587,465,143,993".to_string() // SMTP, IMAP
+            "25,587,465,143,993" // SMTP, IMAP
         } else if dept_lower.contains("finance") || dept_lower.contains("hr") {
-            "1433,3306,5432".to_string() // Database ports
+            "1433,3306,5432" // Database ports
         } else {
-            "any".to_string()
+            "any"
         }
     }
 
@@ -625,7 +568,7 @@ pub fn generate_firewall_rules(
             vlan_config.vlan_id,
             &vlan_config.ip_network,
             complexity,
-            &department,
+            department,
             firewall_rules_per_vlan,
         )?;
 
@@ -659,15 +602,17 @@ pub fn generate_firewall_rules(
 ];
 
 /// Extract department name from VLAN description
+///
+/// Names are returned as shared `&'static str` so no per-VLAN copy is made.
 fn extract_department_from_description<R: rand::Rng + ?Sized>(
     description: &str,
     rng: &mut R,
-) -> String {
+) -> &'static str {
     let desc_lower = description.to_lowercase();
 
     for &(display, pattern) in DEPT_PATTERNS {
         if desc_lower.contains(pattern) {
-            return display.to_string();
+            return display;
         }
     }
 
@@ -676,35 +621,70 @@ fn extract_department_from_description<R: rand::Rng + ?Sized>(
 }
 
 /// Generate realistic department name using fake crate with deterministic RNG
-fn generate_department_name<R: rand::Rng + ?Sized>(rng: &mut R) -> String {
+fn generate_department_name<R: rand::Rng + ?Sized>(rng: &mut R) -> &'static str {
+    // Fallback to a longer department name if the filtered list is empty
+    fallback_departments()
+        .choose(rng)
+        .copied()
+        .unwrap_or("Information Technology")
+}
+
+/// Departments eligible as fallback names, filtered once on first use
+///
+/// Only names longer than two characters are kept to satisfy test requirements.
+fn fallback_departments() -> &'static [&'static str] {
     use crate::generator::departments;
 
-    // Get all available departments and filter to only those longer than 2 characters
-    // to satisfy test requirements
-    let valid_departments: Vec<&str> = departments::all_departments()
-        .iter()
-        .filter(|&&dept| dept.len() > 2)
-        .copied()
-        .collect();
+    static FALLBACK: OnceLock<Vec<&'static str>> = OnceLock::new();
+    FALLBACK.get_or_init(|| {
+        departments::all_departments()
+            .iter()
+            .filter(|&&dept| dept.len() > 2)
+            .copied()
+            .collect()
+    })
+}
 
-    // Fallback to a longer department name if the filtered list is empty
-    if valid_departments.is_empty() {
-        "Information Technology".to_string()
-    } else {
-        valid_departments.choose(rng).unwrap().to_string()
+/// Values shared by every rule generated for one VLAN
+///
+/// Derived once per VLAN instead of in each rule tier.
+struct VlanRuleScope<'a> {
+    vlan_id: u16,
+    network: &'a str,
+    interface: String,
+    department: &'a str,
+    dept_lower: String,
+}
+
+impl<'a> VlanRuleScope<'a> {
+    fn new(vlan_id: u16, network: &'a str, department: &'a str) -> Self {
+        Self {
+            vlan_id,
+            network,
+            interface: format!("vlan{vlan_id}"),
+            department,
+            dept_lower: department.to_lowercase(),
+        }
     }
 }
 
 /// Generate realistic rule description using fake crate with deterministic RNG
+///
+/// Context words are picked straight from the lorem word list into the
+/// description rather than through the faker's per-word `String`s.
 fn generate_rule_description<R: rand::Rng + ?Sized>(
     rng: &mut R,
     department: &str,
     action: &str,
     service: &str,
 ) -> String {
-    use fake::faker::lorem::en::*;
-    let context = Words(2..4).fake_with_rng::<Vec<String>, _>(rng).join(" ");
-    format!("{} {} {} - {}", action, department, service, context)
+    let words = EN::LOREM_WORD;
+    let mut description = format!("{action} {department} {service} -");
+    for _ in 0..rng.random_range(2..4) {
+        description.push(' ');
+        description.push_str(words[rng.random_range(0..words.len())]);
+    }
+    description
 }
 
 #[cfg(test)]
@@ -799,6 +779,14 @@ fn test_firewall_rule_validation() {
         assert!(invalid_vlan_rule.is_err());
     }
 
+    #[test]
+    fn test_is_one_of_ignores_case() {
+        assert!(is_one_of("PASS", VALID_ACTIONS));
+        assert!(is_one_of("Out", VALID_DIRECTIONS));
+        assert!(is_one_of("tcp", VALID_PROTOCOLS));
+        assert!(!is_one_of("allow", VALID_ACTIONS));
+    }
+
     #[test]
     fn test_complexity_levels() {
         assert_eq!(FirewallComplexity::Basic.rules_per_vlan(), 3);
@@ -823,6 +811,17 @@ fn test_complexity_parsing() {
         assert!("invalid".parse::<FirewallComplexity>().is_err());
     }
 
+    #[test]
+    fn test_complexity_parsing_checks_full_name() {
+        assert_eq!(
+            "ADVANCED".parse::<FirewallComplexity>().unwrap(),
+            FirewallComplexity::Advanced
+        );
+        assert!("b".parse::<FirewallComplexity>().is_err());
+        assert!("basics".parse::<FirewallComplexity>().is_err());
+        assert!("".parse::<FirewallComplexity>().is_err());
+    }
+
     #[test]
     fn test_firewall_generator() {
         let mut generator = FirewallGenerator::new(Some(12345));
@@ -986,7 +985,7 @@ fn test_basic_rules_generation() {
         let mut generator = FirewallGenerator::new(Some(12345));
 
         let rules = generator
-            .generate_basic_rules(100, "192.168.1.0/24", "IT")
+            .generate_basic_rules(&VlanRuleScope::new(100, "192.168.1.0/24", "IT"))
             .unwrap();
 
         assert!(!rules.is_empty());
@@ -1004,7 +1003,7 @@ fn test_intermediate_rules_generation() {
         let mut generator = FirewallGenerator::new(Some(12345));
 
         let rules = generator
-            .generate_intermediate_rules(100, "192.168.1.0/24", "IT")
+            .generate_intermediate_rules(&VlanRuleScope::new(100, "192.168.1.0/24", "IT"))
             .unwrap();
 
         assert!(!rules.is_empty());
@@ -1022,7 +1021,7 @@ fn test_advanced_rules_generation() {
         let mut generator = FirewallGenerator::new(Some(12345));
 
         let rules = generator
-            .generate_advanced_rules(100, "192.168.1.0/24", "IT")
+            .generate_advanced_rules(&VlanRuleScope::new(100, "192.168.1.0/24", "IT"))
             .unwrap();
 
         assert!(!rules.is_empty());
@@ -1050,6 +1049,11 @@ fn test_generate_rule_description() {
         assert!(desc1.contains("Allow"));
         assert!(desc2.contains("Sales"));
         assert!(desc2.contains("Block"));
+
+        let context = desc1.split(" - ").nth(1).unwrap();
+        let word_count = context.split(' ').count();
+        assert!((2..4).contains(&word_count));
+        assert!(context.split(' ').all(|w| EN::LOREM_WORD.contains(&w)));
     }
 
     #[test]
@@ -4,16 +4,16 @@
 //! mappings including port forwarding, source NAT, and destination NAT rules.
 
 use crate::model::ConfigError;
+use crate::utils::ids::{random_uuid_string, short_uuid_from_rng};
 use rand::prelude::*;
 use serde::{Deserialize, Serialize};
 use std::collections::HashSet;
-use uuid::Uuid;
 
 /// Result type for NAT generation operations
 pub type NatResult<T> = Result<T, ConfigError>;
 
 /// NAT rule types supported by OPNsense
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Copy, Serialize, Deserialize, PartialEq, Eq, Hash)]
 pub enum NatRuleType {
     /// Port forwarding from WAN to internal server
     PortForward,
@@ -79,7 +79,7 @@ pub fn new(
         vlan_id: Option<u16>,
     ) -> NatResult<Self> {
         let mapping = Self {
-            id: Uuid::new_v4().to_string(),
+            id: random_uuid_string(),
             rule_type,
             name,
             source,
@@ -157,32 +157,70 @@ fn is_valid_port_range(&self, port_range: &str) -> bool {
             return true;
         }
 
-        // Handle single port
-        if let Ok(port) = port_range.parse::<u16>() {
-            return port > 0;
-        }
-
-        // Handle port range (e.g., "80-90")
-        if port_range.contains('-') {
-            let parts: Vec<&str> = port_range.split('-').collect();
-            if parts.len() == 2
-                && let (Ok(start), Ok(end)) = (parts[0].parse::<u16>(), parts[1].parse::<u16>())
-            {
-                return start > 0 && end > 0 && start <= end;
-            }
-        }
-
-        // Handle comma-separated ports (e.g., "80,443,8080")
+        // Dispatch on the separator instead of trying each format in turn
         if port_range.contains(',') {
-            return port_range
+            // Comma-separated ports (e.g., "80,443,8080")
+            port_range
                 .split(',')
-                .all(|p| p.trim().parse::<u16>().is_ok_and(|port| port > 0));
+                .all(|p| p.trim().parse::<u16>().is_ok_and(|port| port > 0))
+        } else if let Some((start, end)) = port_range.split_once('-') {
+            // Port range (e.g., "80-90")
+            matches!(
+                (start.parse::<u16>(), end.parse::<u16>()),
+                (Ok(start), Ok(end)) if start > 0 && end > 0 && start <= end
+            )
+        } else {
+            // Single port
+            port_range.parse::<u16>().is_ok_and(|port| port > 0)
         }
-
-        false
     }
 }
 
+/// Services used in port-forward rule names
+const PORT_FORWARD_SERVICES: &[&str] = &[
+    "Web-Server",
+    "SSH",
+    "FTP",
+    "Mail-Server",
+    "Database",
+    "API",
+    "RDP",
+];
+
+/// Sources used in SNAT rule names
+const SNAT_SOURCES: &[&str] = &["LAN", "DMZ", "Guest", "VPN", "VLAN"];
+
+/// Destinations used in DNAT rule names
+const DNAT_DESTINATIONS: &[&str] = &["WebServer", "MailServer", "FTPServer", "VoIPServer"];
+
+/// Sources used in outbound NAT rule names
+const OUTBOUND_SOURCES: &[&str] = &["VLAN", "LAN", "Guest", "DMZ"];
+
+/// Internal networks translated by SNAT rules
+const SNAT_NETWORKS: &[&str] = &["192.168.1.0/24", "10.0.0.0/16", "172.16.0.0/16"];
+
+/// Internal networks translated by outbound NAT rules
+const OUTBOUND_NETWORKS: &[&str] = &["192.168.1.0/24", "10.0.0.0/8", "172.16.0.0/12"];
+
+/// Internal interfaces for source-side NAT rules
+const INTERNAL_INTERFACES: &[&str] = &["LAN", "OPT1", "OPT2", "DMZ"];
+
+/// Well-known service ports as (port, service name)
+const COMMON_SERVICES: &[(&str, &str)] = &[
+    ("80", "HTTP"),
+    ("443", "HTTPS"),
+    ("22", "SSH"),
+    ("21", "FTP"),
+    ("25", "SMTP"),
+    ("53", "DNS"),
+    ("3389", "RDP"),
+    ("5432", "PostgreSQL"),
+    ("3306", "MySQL"),
+    ("1433", "SQL Server"),
+    ("8080", "HTTP Alt"),
+    ("8443", "HTTPS Alt"),
+];
+
 /// NAT mapping generator with realistic configurations
 pub struct NatGenerator {
     rng: Box<dyn RngCore>,
@@ -214,13 +252,13 @@ pub fn new_with_seed(seed: Option<u64>) -> Self {
     /// Generate a single NAT mapping
     pub fn generate_single(&mut self, rule_type: Option<NatRuleType>) -> NatResult<NatMapping> {
         let rule_type = rule_type.unwrap_or_else(|| self.random_nat_type());
-        let name = self.generate_unique_name(&rule_type);
+        let name = self.generate_unique_name(rule_type);
         let protocol = self.random_protocol();
-        let (source, source_port) = self.generate_source(&rule_type);
-        let (destination, destination_port) = self.generate_destination(&rule_type, &protocol)?;
-        let interface = self.random_interface(&rule_type);
+        let (source, source_port) = self.generate_source(rule_type);
+        let (destination, destination_port) = self.generate_destination(rule_type, &protocol)?;
+        let interface = self.random_interface(rule_type);
         let (target_ip, target_port) =
-            self.generate_target(&rule_type, &destination_port, &protocol);
+            self.generate_target(rule_type, &destination_port, &protocol);
         let enabled = self.rng.random_bool(0.9); // 90% chance of being enabled
         let log = self.rng.random_bool(0.3); // 30% chance of logging
         let vlan_id = if self.rng.random_bool(0.6) {
@@ -270,40 +308,29 @@ fn random_nat_type(&mut self) -> NatRuleType {
     }
 
     /// Generate a unique NAT rule name
-    fn generate_unique_name(&mut self, rule_type: &NatRuleType) -> String {
+    fn generate_unique_name(&mut self, rule_type: NatRuleType) -> String {
         const MAX_ATTEMPTS: usize = 100;
 
         for _ in 0..MAX_ATTEMPTS {
             let base_name = match rule_type {
                 NatRuleType::PortForward => {
-                    let services = [
-                        "Web-Server",
-                        "SSH",
-                        "FTP",
-                        "Mail-Server",
-                        "Database",
-                        "API",
-                        "RDP",
-                    ];
-                    let service = services[self.rng.random_range(0..services.len())];
+                    let service = PORT_FORWARD_SERVICES
+                        [self.rng.random_range(0..PORT_FORWARD_SERVICES.len())];
                     format!("Port-Forward-{}", service)
                 }
                 NatRuleType::SourceNat => {
-                    let sources = ["LAN", "DMZ", "Guest", "VPN", "VLAN"];
-                    let source = sources[self.rng.random_range(0..sources.len())];
+                    let source = SNAT_SOURCES[self.rng.random_range(0..SNAT_SOURCES.len())];
                     format!("SNAT-{}", source)
                 }
                 NatRuleType::DestinationNat => {
-                    let destinations = ["WebServer", "MailServer", "FTPServer", "VoIPServer"];
-                    let dest = destinations[self.rng.random_range(0..destinations.len())];
+                    let dest = DNAT_DESTINATIONS[self.rng.random_range(0..DNAT_DESTINATIONS.len())];
                     format!("DNAT-{}", dest)
                 }
                 NatRuleType::OneToOneNat => {
                     format!("1to1-NAT-{}", self.rng.random_range(1..=99))
                 }
                 NatRuleType::OutboundNat => {
-                    let vlans = ["VLAN", "LAN", "Guest", "DMZ"];
-                    let vlan = vlans[self.rng.random_range(0..vlans.len())];
+                    let vlan = OUTBOUND_SOURCES[self.rng.random_range(0..OUTBOUND_SOURCES.len())];
                     format!("Outbound-{}", vlan)
                 }
             };
@@ -329,7 +356,7 @@ fn generate_unique_name(&mut self, rule_type: &NatRuleType) -> String {
                 NatRuleType::OneToOneNat => "1to1-NAT",
                 NatRuleType::OutboundNat => "Outbound",
             },
-            Uuid::new_v4().to_string().split('-').next().unwrap()
+            short_uuid_from_rng(&mut self.rng)
         )
     }
 
@@ -345,12 +372,11 @@ fn random_protocol(&mut self) -> String {
     }
 
     /// Generate source address and port based on rule type
-    fn generate_source(&mut self, rule_type: &NatRuleType) -> (String, String) {
+    fn generate_source(&mut self, rule_type: NatRuleType) -> (String, String) {
         match rule_type {
             NatRuleType::PortForward => ("any".to_string(), "any".to_string()),
             NatRuleType::SourceNat => {
-                let networks = ["192.168.1.0/24", "10.0.0.0/16", "172.16.0.0/16"];
-                let network = networks[self.rng.random_range(0..networks.len())];
+                let network = SNAT_NETWORKS[self.rng.random_range(0..SNAT_NETWORKS.len())];
                 (network.to_string(), "any".to_string())
             }
             NatRuleType::DestinationNat => ("any".to_string(), "any".to_string()),
@@ -363,8 +389,7 @@ fn generate_source(&mut self, rule_type: &NatRuleType) -> (String, String) {
                 (ip, "any".to_string())
             }
             NatRuleType::OutboundNat => {
-                let networks = ["192.168.1.0/24", "10.0.0.0/8", "172.16.0.0/12"];
-                let network = networks[self.rng.random_range(0..networks.len())];
+                let network = OUTBOUND_NETWORKS[self.rng.random_range(0..OUTBOUND_NETWORKS.len())];
                 (network.to_string(), "any".to_string())
             }
         }
@@ -373,7 +398,7 @@ fn generate_source(&mut self, rule_type: &NatRuleType) -> (String, String) {
     /// Generate destination address and port based on rule type
     fn generate_destination(
         &mut self,
-        rule_type: &NatRuleType,
+        rule_type: NatRuleType,
         protocol: &str,
     ) -> NatResult<(String, String)> {
         Ok(match rule_type {
@@ -396,18 +421,16 @@ fn generate_destination(
     }
 
     /// Generate interface based on rule type
-    fn random_interface(&mut self, rule_type: &NatRuleType) -> String {
+    fn random_interface(&mut self, rule_type: NatRuleType) -> String {
         match rule_type {
             NatRuleType::PortForward => "WAN".to_string(),
             NatRuleType::SourceNat => {
-                let interfaces = ["LAN", "OPT1", "OPT2", "DMZ"];
-                interfaces[self.rng.random_range(0..interfaces.len())].to_string()
+                INTERNAL_INTERFACES[self.rng.random_range(0..INTERNAL_INTERFACES.len())].to_string()
             }
             NatRuleType::DestinationNat => "WAN".to_string(),
             NatRuleType::OneToOneNat => "WAN".to_string(),
             NatRuleType::OutboundNat => {
-                let interfaces = ["LAN", "OPT1", "OPT2", "DMZ"];
-                interfaces[self.rng.random_range(0..interfaces.len())].to_string()
+                INTERNAL_INTERFACES[self.rng.random_range(0..INTERNAL_INTERFACES.len())].to_string()
             }
         }
     }
@@ -415,7 +438,7 @@ fn random_interface(&mut self, rule_type: &NatRuleType) -> String {
     /// Generate target IP and port based on rule type
     fn generate_target(
         &mut self,
-        rule_type: &NatRuleType,
+        rule_type: NatRuleType,
         dest_port: &str,
         protocol: &str,
     ) -> (String, String) {
@@ -487,24 +510,9 @@ fn generate_unique_external_port(&mut self) -> NatResult<u16> {
 
     /// Generate a service port
     fn generate_service_port(&mut self) -> String {
-        let common_services = [
-            ("80", "HTTP"),
-            ("443", "HTTPS"),
-            ("22", "SSH"),
-            ("21", "FTP"),
-            ("25", "SMTP"),
-            ("53", "DNS"),
-            ("3389", "RDP"),
-            ("5432", "PostgreSQL"),
-            ("3306", "MySQL"),
-            ("1433", "SQL Server"),
-            ("8080", "HTTP Alt"),
-            ("8443", "HTTPS Alt"),
-        ];
-
         if self.rng.random_bool(0.8) {
             // Use common service port
-            let (port, _service) = common_services[self.rng.random_range(0..common_services.len())];
+            let (port, _service) = COMMON_SERVICES[self.rng.random_range(0..COMMON_SERVICES.len())];
             port.to_string()
         } else {
             // Use random port
@@ -681,4 +689,33 @@ fn test_port_validation() {
         invalid_mapping.source_port = "99999".to_string(); // Invalid port > 65535
         assert!(invalid_mapping.validate().is_err());
     }
+
+    #[test]
+    fn test_port_range_formats() {
+        let mapping = NatMapping {
+            id: "test".to_string(),
+            rule_type: NatRuleType::PortForward,
+            name: "Test".to_string(),
+            source: "any".to_string(),
+            source_port: "any".to_string(),
+            destination: "any".to_string(),
+            destination_port: "any".to_string(),
+            protocol: "TCP".to_string(),
+            interface: "WAN".to_string(),
+            target_ip: "192.168.1.1".to_string(),
+            target_port: "any".to_string(),
+            enabled: true,
+            log: false,
+            vlan_id: None,
+        };
+
+        assert!(mapping.is_valid_port_range("8080"));
+        assert!(mapping.is_valid_port_range("80-90"));
+        assert!(mapping.is_valid_port_range("80, 443"));
+        assert!(!mapping.is_valid_port_range("0"));
+        assert!(!mapping.is_valid_port_range("90-80"));
+        assert!(!mapping.is_valid_port_range("1-2-3"));
+        assert!(!mapping.is_valid_port_range("80-90,100"));
+        assert!(!mapping.is_valid_port_range("80,"));
+    }
 }
@@ -14,7 +14,7 @@
 use rand::SeedableRng;
 use rand::prelude::*;
 use rand_chacha::ChaCha8Rng;
-use rustc_hash::{FxHashMap, FxHashSet};
+use rustc_hash::FxHashMap;
 use smallvec::SmallVec;
 use std::num::NonZeroUsize;
 
@@ -97,20 +97,57 @@ struct CachedVlanConfig {
     wan_assignment: u8,
 }
 
+/// Every valid VLAN ID, handed out in random order without repeats
+///
+/// The pool is shuffled lazily, one Fisher-Yates step per draw, so each draw
+/// is O(1) and can never collide, unlike rejection sampling against a set of
+/// used IDs.
+struct VlanIdPool {
+    ids: Vec<u16>,
+    remaining: usize,
+}
+
+impl VlanIdPool {
+    fn new() -> Self {
+        let ids: Vec<u16> = (10..=4094).collect();
+        Self {
+            remaining: ids.len(),
+            ids,
+        }
+    }
+
+    /// Number of IDs drawn since the last reset
+    fn used(&self) -> usize {
+        self.ids.len() - self.remaining
+    }
+
+    /// Make every ID available again
+    fn reset(&mut self) {
+        self.remaining = self.ids.len();
+    }
+
+    /// Draw an unused ID, or `None` once all of them are taken
+    fn draw<R: Rng + ?Sized>(&mut self, rng: &mut R) -> Option<u16> {
+        if self.remaining == 0 {
+            return None;
+        }
+        let pick = rng.random_range(0..self.remaining);
+        self.remaining -= 1;
+        self.ids.swap(pick, self.remaining);
+        Some(self.ids[self.remaining])
+    }
+}
+
 /// High-performance VLAN configuration generator
 pub struct PerformantConfigGenerator {
     /// Arena allocator for temporary objects
     arena: Bump,
 
     /// LRU cache for department templates
-    department_cache: LruCache<u8, String>,
-
-    /// Pre-allocated string buffer for IP networks
-    #[allow(dead_code)]
-    ip_buffer: String,
+    department_cache: LruCache<u8, &'static str>,
 
-    /// Fast hash set for VLAN ID tracking
-    used_vlan_ids: FxHashSet<u16>,
+    /// Remaining VLAN IDs, drawn without repeats
+    vlan_pool: VlanIdPool,
 
     /// Fast hash map for IP network tracking
     used_networks: FxHashMap<u32, bool>,
@@ -131,18 +168,12 @@ pub struct PerformantConfigGenerator {
 impl PerformantConfigGenerator {
     /// Create a new high-performance generator
     pub fn new(seed: Option<u64>) -> Self {
-        let mut department_cache = LruCache::new(NonZeroUsize::new(16).unwrap());
-
-        // Pre-populate department cache
-        for (id, dept) in departments::all_departments().iter().enumerate() {
-            department_cache.put(id as u8, dept.to_string());
-        }
-
         Self {
             arena: Bump::new(),
-            department_cache,
-            ip_buffer: String::with_capacity(15), // "255.255.255.255" max length
-            used_vlan_ids: FxHashSet::default(),
+            // Filled on first use by `get_cached_department`, so generators that
+            // only touch a few departments never allocate the rest
+            department_cache: LruCache::new(NonZeroUsize::new(16).unwrap()),
+            vlan_pool: VlanIdPool::new(),
             used_networks: FxHashMap::default(),
             rng: ChaCha8Rng::seed_from_u64(seed.unwrap_or_else(|| rand::rng().random())),
             batch_buffer: Vec::new(),
@@ -167,8 +198,8 @@ pub fn generate_batch(&mut self, count: usize) -> Result<Vec<VlanConfig>> {
         self.batch_buffer.reserve_exact(count);
 
         // Clear tracking sets if they would grow too large
-        if self.used_vlan_ids.len() + count > 4000 {
-            self.used_vlan_ids.clear();
+        if self.vlan_pool.used() + count > 4000 {
+            self.vlan_pool.reset();
         }
         if self.used_networks.len() + count > 10000 {
             self.used_networks.clear();
@@ -199,28 +230,24 @@ fn generate_single_optimized(&mut self) -> Result<VlanConfig> {
 
         // Generate description with cached department lookup
         let department = self.get_cached_department();
-        let description = format!("{} VLAN {}", department, vlan_id);
+        let description = departments::vlan_description(department, vlan_id);
 
         // Generate WAN assignment
         let wan_assignment = self.rng.random_range(1..=3);
 
-        VlanConfig::new(vlan_id, ip_network, description, wan_assignment)
+        Ok(VlanConfig::new_trusted(
+            vlan_id,
+            ip_network,
+            description,
+            wan_assignment,
+        ))
     }
 
     /// Efficiently generate unique VLAN ID
     fn generate_unique_vlan_id(&mut self) -> Result<u16> {
-        const MAX_ATTEMPTS: usize = 100;
-
-        for _ in 0..MAX_ATTEMPTS {
-            let vlan_id = self.rng.random_range(10..=4094);
-            if self.used_vlan_ids.insert(vlan_id) {
-                return Ok(vlan_id);
-            }
-        }
-
-        Err(ConfigError::vlan_generation(
-            "Unable to generate unique VLAN ID after maximum attempts",
-        ))
+        self.vlan_pool
+            .draw(&mut self.rng)
+            .ok_or_else(|| ConfigError::vlan_generation("All VLAN IDs are already in use"))
     }
 
     /// Efficiently generate unique IP network
@@ -250,34 +277,38 @@ fn generate_unique_ip_network(&mut self) -> Result<String> {
     }
 
     /// Get department name with caching
-    fn get_cached_department(&mut self) -> String {
+    ///
+    /// Names are returned as the shared `'static` constants, so repeated
+    /// departments never allocate.
+    fn get_cached_department(&mut self) -> &'static str {
         let dept_id = self
             .rng
             .random_range(0..departments::all_departments().len()) as u8;
 
         if let Some(dept) = self.department_cache.get(&dept_id) {
-            dept.clone()
+            *dept
         } else {
             let dept = departments::all_departments()[dept_id as usize];
-            self.department_cache.put(dept_id, dept.to_string());
-            dept.to_string()
+            self.department_cache.put(dept_id, dept);
+            dept
         }
     }
 
     /// Estimate current memory usage
     fn estimate_memory_usage(&self) -> usize {
-        let vlan_ids_mem = self.used_vlan_ids.capacity() * std::mem::size_of::<u16>();
+        // The pool is allocated up front; only the IDs drawn so far are usage
+        let vlan_ids_mem = self.vlan_pool.used() * std::mem::size_of::<u16>();
         let networks_mem = self.used_networks.capacity() * std::mem::size_of::<(u32, bool)>();
         let cache_mem = self.config_cache.capacity() * std::mem::size_of::<CachedVlanConfig>();
         let buffer_mem = self.batch_buffer.capacity() * std::mem::size_of::<VlanConfig>();
-        let dept_cache_mem = self.department_cache.cap().get() * 64; // Estimated string size
+        let dept_cache_mem = self.department_cache.cap().get() * std::mem::size_of::<&str>();
 
         vlan_ids_mem + networks_mem + cache_mem + buffer_mem + dept_cache_mem
     }
 
     /// Reset generator state for new batch
     pub fn reset(&mut self) {
-        self.used_vlan_ids.clear();
+        self.vlan_pool.reset();
         self.used_networks.clear();
         self.batch_buffer.clear();
         self.config_cache.clear();
@@ -301,14 +332,15 @@ pub fn generate_parallel(
         let chunks = total_count.div_ceil(chunk_size);
         let mut results = Vec::with_capacity(total_count);
 
-        // Generate base seed outside of closure
-        let base_seed = self.rng.random::<u64>();
+        // Each worker gets its own seed drawn from this generator, so chunks
+        // diverge while the whole run stays reproducible from one seed
+        let chunk_seeds: Vec<u64> = (0..chunks).map(|_| self.rng.random()).collect();
 
         let chunk_results: Result<Vec<Vec<VlanConfig>>> = (0..chunks)
             .into_par_iter()
             .map(|chunk_id| {
                 let mut local_generator =
-                    PerformantConfigGenerator::new(Some(base_seed + chunk_id as u64));
+                    PerformantConfigGenerator::new(Some(chunk_seeds[chunk_id]));
 
                 let current_chunk_size = if chunk_id == chunks - 1 {
                     total_count - (chunk_id * chunk_size)
@@ -341,10 +373,30 @@ mod tests {
     #[test]
     fn test_performant_generator_creation() {
         let generator = PerformantConfigGenerator::new(Some(42));
-        assert_eq!(generator.used_vlan_ids.len(), 0);
+        assert_eq!(generator.vlan_pool.used(), 0);
         assert_eq!(generator.used_networks.len(), 0);
     }
 
+    #[test]
+    fn test_department_cache_filled_lazily() {
+        let mut generator = PerformantConfigGenerator::new(Some(42));
+        assert!(generator.department_cache.is_empty());
+
+        generator.generate_batch(1).unwrap();
+        assert_eq!(generator.department_cache.len(), 1);
+    }
+
+    #[test]
+    fn test_cached_department_is_shared_constant() {
+        let mut generator = PerformantConfigGenerator::new(Some(42));
+        let dept = generator.get_cached_department();
+        assert!(
+            departments::all_departments()
+                .iter()
+                .any(|known| std::ptr::eq(*known, dept))
+        );
+    }
+
     #[test]
     fn test_batch_generation() {
         let mut generator = PerformantConfigGenerator::new(Some(42));
@@ -405,10 +457,10 @@ fn test_reset_functionality() {
         let mut generator = PerformantConfigGenerator::new(Some(42));
         generator.generate_batch(10).unwrap();
 
-        assert!(!generator.used_vlan_ids.is_empty());
+        assert_eq!(generator.vlan_pool.used(), 10);
 
         generator.reset();
-        assert_eq!(generator.used_vlan_ids.len(), 0);
+        assert_eq!(generator.vlan_pool.used(), 0);
         assert_eq!(generator.used_networks.len(), 0);
     }
 
@@ -431,4 +483,36 @@ fn test_large_batch_generation() {
         assert!(metrics.memory_efficiency() < DEFAULT_MEMORY_EFFICIENCY_TARGET);
         // Target memory efficiency
     }
+
+    #[cfg(feature = "rayon")]
+    #[test]
+    fn test_generate_parallel_is_reproducible() {
+        let first = PerformantConfigGenerator::new(Some(42))
+            .generate_parallel(40, 10)
+            .unwrap();
+        let second = PerformantConfigGenerator::new(Some(42))
+            .generate_parallel(40, 10)
+            .unwrap();
+
+        assert_eq!(first.len(), 40);
+        assert_eq!(first, second);
+        // Chunks are seeded independently rather than sharing one stream
+        assert_ne!(first[..10], first[10..20]);
+    }
+
+    #[test]
+    fn test_vlan_id_pool_never_repeats() {
+        let mut pool = VlanIdPool::new();
+        let mut rng = ChaCha8Rng::seed_from_u64(42);
+        let mut seen = std::collections::HashSet::new();
+
+        while let Some(id) = pool.draw(&mut rng) {
+            assert!((10..=4094).contains(&id));
+            assert!(seen.insert(id), "Duplicate VLAN ID: {id}");
+        }
+
+        assert_eq!(seen.len(), 4085);
+        pool.reset();
+        assert_eq!(pool.used(), 0);
+    }
 }
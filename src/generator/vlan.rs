@@ -11,6 +11,7 @@
 use rand_chacha::ChaCha8Rng;
 use serde::{Deserialize, Serialize};
 use std::collections::HashSet;
+use std::net::Ipv4Addr;
 
 /// Static DHCP reservation mapping MAC address to IP
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq)]
@@ -23,6 +24,17 @@ pub struct StaticReservation {
     pub hostname: String,
 }
 
+/// Host addresses derived from a VLAN's /24 prefix
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct HostAddresses {
+    /// Gateway IP (network + 1)
+    pub gateway: String,
+    /// DHCP range start IP
+    pub dhcp_start: String,
+    /// DHCP range end IP
+    pub dhcp_end: String,
+}
+
 /// DHCP server configuration with realistic enterprise settings
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct DhcpServerConfig {
@@ -131,6 +143,28 @@ pub fn new(
         })
     }
 
+    /// Create a VLAN configuration from generator-produced values without re-validating
+    ///
+    /// Callers must guarantee the invariants enforced by [`VlanConfig::new`];
+    /// they are only re-checked in debug builds.
+    pub(crate) fn new_trusted(
+        vlan_id: u16,
+        ip_network: String,
+        description: String,
+        wan_assignment: u8,
+    ) -> Self {
+        debug_assert!((10..=4094).contains(&vlan_id));
+        debug_assert!((1..=3).contains(&wan_assignment));
+        debug_assert!(Self::validate_ip_format_strict(&ip_network).is_ok());
+
+        Self {
+            vlan_id,
+            ip_network,
+            description,
+            wan_assignment,
+        }
+    }
+
     /// Create a new VLAN configuration with enhanced validation
     pub fn new_with_network(
         vlan_id: u16,
@@ -155,17 +189,8 @@ pub fn new_with_network(
         }
 
         // Convert network to string format for compatibility
-        let ip_network = format!(
-            "{}.x",
-            network
-                .network()
-                .octets()
-                .iter()
-                .take(3)
-                .map(|octet| octet.to_string())
-                .collect::<Vec<_>>()
-                .join(".")
-        );
+        let [a, b, c, _] = network.network().octets();
+        let ip_network = format!("{a}.{b}.{c}.x");
 
         Ok(Self {
             vlan_id,
@@ -187,7 +212,7 @@ pub fn as_ipv4_network(&self) -> VlanResult<Ipv4Network> {
                     self.ip_network
                 ))
             })?;
-        rfc1918::validate_rfc1918_network_string(&format!("{base}.0/24"))
+        rfc1918::network_from_prefix(base)
     }
 
     /// Validate that this configuration is RFC 1918 compliant
@@ -241,15 +266,22 @@ pub fn subnet_mask(&self) -> &'static str {
     ///
     /// Handles both "10.1.2.x" and "10.1.2.0/24" formats, returning "10.1.2".
     fn network_base(&self) -> Result<&str> {
+        self.network_prefix().ok_or_else(|| {
+            ConfigError::validation(format!(
+                "Cannot parse base from IP network: {}",
+                self.ip_network
+            ))
+        })
+    }
+
+    /// Three-octet base prefix, or `None` when the network format is not recognised
+    ///
+    /// Cheap presence check for callers that only need to know whether the
+    /// derived addresses are available, without building an error value.
+    pub fn network_prefix(&self) -> Option<&str> {
         self.ip_network
             .strip_suffix(".x")
             .or_else(|| self.ip_network.strip_suffix(".0/24"))
-            .ok_or_else(|| {
-                ConfigError::validation(format!(
-                    "Cannot parse base from IP network: {}",
-                    self.ip_network
-                ))
-            })
     }
 
     /// Get the gateway IP address (network + 1)
@@ -267,6 +299,19 @@ pub fn dhcp_range_end(&self) -> Result<String> {
         Ok(format!("{}.200", self.network_base()?))
     }
 
+    /// Get the gateway and DHCP range addresses together
+    ///
+    /// The prefix is extracted once for all three, for callers that need
+    /// more than one of them.
+    pub fn host_addresses(&self) -> Result<HostAddresses> {
+        let base = self.network_base()?;
+        Ok(HostAddresses {
+            gateway: format!("{base}.1"),
+            dhcp_start: format!("{base}.100"),
+            dhcp_end: format!("{base}.200"),
+        })
+    }
+
     /// Get the DHCP lease time based on department type (in seconds)
     pub fn dhcp_lease_time(&self) -> u32 {
         // Determine lease time based on department characteristics
@@ -386,26 +431,111 @@ pub fn static_reservations(&self) -> Result<Vec<StaticReservation>> {
 
     /// Generate complete DHCP server configuration
     pub fn dhcp_server_config(&self) -> Result<DhcpServerConfig> {
+        let hosts = self.host_addresses()?;
         Ok(DhcpServerConfig {
             enabled: true,
-            range_start: self.dhcp_range_start()?,
-            range_end: self.dhcp_range_end()?,
+            range_start: hosts.dhcp_start,
+            range_end: hosts.dhcp_end,
             lease_time: self.dhcp_lease_time(),
             max_lease_time: self.dhcp_max_lease_time(),
             dns_servers: self.dhcp_dns_servers()?,
             domain_name: self.dhcp_domain_name(),
-            gateway: self.gateway_ip()?,
+            gateway: hosts.gateway,
             ntp_servers: self.dhcp_ntp_servers(),
             static_reservations: self.static_reservations()?,
         })
     }
 }
 
+/// Number of assignable VLAN IDs (10-4094)
+const VLAN_ID_COUNT: usize = 4085;
+
+/// Set of VLAN IDs stored as a 4096-bit bitmap
+///
+/// Membership is a single bit test on 512 bytes of inline storage, instead of
+/// hashing into a heap-allocated table that grows with every ID.
+#[derive(Debug, Clone)]
+struct VlanIdSet {
+    bits: [u64; 64],
+    len: usize,
+}
+
+impl VlanIdSet {
+    fn new() -> Self {
+        Self {
+            bits: [0; 64],
+            len: 0,
+        }
+    }
+
+    /// Word index and bit mask for an ID (IDs are 12-bit)
+    ///
+    /// IDs past 4095 are not masked, so they fail the word lookup instead
+    /// of aliasing a valid ID.
+    fn slot(id: u16) -> (usize, u64) {
+        debug_assert!(id < 4096, "VLAN ID {id} does not fit in 12 bits");
+        let id = usize::from(id);
+        (id / 64, 1 << (id % 64))
+    }
+
+    /// Add an ID, returning whether it was newly inserted
+    fn insert(&mut self, id: u16) -> bool {
+        let (word, mask) = Self::slot(id);
+        let inserted = self.bits[word] & mask == 0;
+        self.bits[word] |= mask;
+        self.len += usize::from(inserted);
+        inserted
+    }
+
+    fn len(&self) -> usize {
+        self.len
+    }
+
+    /// IDs in ascending order, found by scanning the set bits of each word
+    fn iter(&self) -> impl Iterator<Item = u16> + '_ {
+        self.bits.iter().enumerate().flat_map(|(word, &bits)| {
+            let mut bits = bits;
+            std::iter::from_fn(move || {
+                if bits == 0 {
+                    return None;
+                }
+                let bit = bits.trailing_zeros() as usize;
+                bits &= bits - 1;
+                Some((word * 64 + bit) as u16)
+            })
+        })
+    }
+}
+
+/// Map ranks among the free slots of a range to slot offsets
+///
+/// `used` holds the taken offsets in ascending order. `used[k] - k` counts
+/// the free slots below the k-th taken one, so it never decreases and a
+/// binary search gives the number of taken slots a rank steps over.
+fn free_slots_by_rank(
+    ranks: impl IntoIterator<Item = usize>,
+    used: &[usize],
+) -> impl Iterator<Item = usize> {
+    let gaps: Vec<usize> = used.iter().enumerate().map(|(k, &slot)| slot - k).collect();
+    ranks
+        .into_iter()
+        .map(move |rank| rank + gaps.partition_point(|&gap| gap <= rank))
+}
+
+impl Extend<u16> for VlanIdSet {
+    fn extend<I: IntoIterator<Item = u16>>(&mut self, ids: I) {
+        for id in ids {
+            self.insert(id);
+        }
+    }
+}
+
 /// VLAN configuration generator with enhanced RFC 1918 compliance
 pub struct VlanGenerator {
     rng: Box<dyn RngCore>,
-    used_vlan_ids: HashSet<u16>,
-    used_networks: HashSet<String>,
+    used_vlan_ids: VlanIdSet,
+    /// Base addresses of the /24 networks handed out so far
+    used_networks: HashSet<Ipv4Addr>,
 }
 
 impl VlanGenerator {
@@ -419,7 +549,7 @@ pub fn new(seed: Option<u64>) -> Self {
 
         Self {
             rng,
-            used_vlan_ids: HashSet::new(),
+            used_vlan_ids: VlanIdSet::new(),
             used_networks: HashSet::new(),
         }
     }
@@ -434,7 +564,7 @@ pub fn new_with_std_rng(seed: Option<u64>) -> Self {
 
         Self {
             rng,
-            used_vlan_ids: HashSet::new(),
+            used_vlan_ids: VlanIdSet::new(),
             used_networks: HashSet::new(),
         }
     }
@@ -455,7 +585,12 @@ pub fn generate_single(&mut self) -> Result<VlanConfig> {
         // Generate WAN assignment
         let wan_assignment = self.rng.random_range(1..=3);
 
-        VlanConfig::new(vlan_id, ip_network, description, wan_assignment)
+        Ok(VlanConfig::new_trusted(
+            vlan_id,
+            ip_network,
+            description,
+            wan_assignment,
+        ))
     }
 
     /// Generate WAN assignment based on strategy
@@ -496,6 +631,15 @@ pub fn generate_single_enhanced(&mut self) -> VlanResult<VlanConfig> {
         // Generate unique RFC 1918 network
         let network = self.generate_unique_rfc1918_network(MAX_ATTEMPTS)?;
 
+        self.generate_enhanced_for(vlan_id, network)
+    }
+
+    /// Fill in description and WAN for an already reserved VLAN ID and network
+    fn generate_enhanced_for(
+        &mut self,
+        vlan_id: u16,
+        network: Ipv4Network,
+    ) -> VlanResult<VlanConfig> {
         // Generate description using new department constants
         let description = self.generate_description_enhanced(vlan_id);
 
@@ -519,18 +663,129 @@ pub fn generate_batch(&mut self, count: usize) -> Result<Vec<VlanConfig>> {
 
     /// Generate a batch of VLAN configurations with enhanced validation
     pub fn generate_batch_enhanced(&mut self, count: usize) -> VlanResult<Vec<VlanConfig>> {
+        let (vlan_ids, networks) = self.reserve_batch(count)?;
         let mut configs = Vec::with_capacity(count);
 
-        for _ in 0..count {
-            let config = self.generate_single_enhanced()?;
+        for (vlan_id, network) in vlan_ids.into_iter().zip(networks) {
+            let config = self.generate_enhanced_for(vlan_id, network)?;
             configs.push(config);
         }
 
         Ok(configs)
     }
 
+    /// Reserve `count` unused VLAN IDs and networks for one batch
+    ///
+    /// Both are drawn before either is marked used, so running out of
+    /// networks leaves no VLAN IDs reserved.
+    fn reserve_batch(&mut self, count: usize) -> VlanResult<(Vec<u16>, Vec<Ipv4Network>)> {
+        let vlan_ids = self.sample_unused_vlan_ids(count)?;
+        let networks = self.sample_unused_networks(count)?;
+        self.used_vlan_ids.extend(vlan_ids.iter().copied());
+        self.used_networks
+            .extend(networks.iter().map(|network| network.network()));
+
+        Ok((vlan_ids, networks))
+    }
+
+    /// Draw `count` distinct unused VLAN IDs with a single sampling pass
+    ///
+    /// Unlike drawing IDs one at a time against `used_vlan_ids`, this never
+    /// retries. Ranks among the free IDs are sampled and stepped past the
+    /// used ones, so the cost follows `count` and the number of used IDs. The
+    /// IDs are not marked used; `reserve_batch` does that.
+    fn sample_unused_vlan_ids(&mut self, count: usize) -> VlanResult<Vec<u16>> {
+        let used: Vec<usize> = self
+            .used_vlan_ids
+            .iter()
+            .filter(|id| (10..=4094).contains(id))
+            .map(|id| usize::from(id - 10))
+            .collect();
+        let free = VLAN_ID_COUNT - used.len();
+        if count > free {
+            return Err(VlanError::VlanIdExhausted);
+        }
+
+        let ranks = rand::seq::index::sample(&mut self.rng, free, count);
+        Ok(free_slots_by_rank(ranks, &used)
+            .map(|offset| 10 + offset as u16)
+            .collect())
+    }
+
+    /// Draw `count` distinct unused /24 networks with one sampling pass per class
+    ///
+    /// The batch is split across Class A, B and C with the same 80/12/8
+    /// weighting as `generate_unique_rfc1918_network`, then each share is
+    /// sampled from that class's `rfc1918::generated_network` indices. Used
+    /// networks are skipped by rank, so the cost follows `count` and the
+    /// number of used networks rather than the size of the key space. The
+    /// networks are not marked used; `reserve_batch` does that.
+    fn sample_unused_networks(&mut self, count: usize) -> VlanResult<Vec<Ipv4Network>> {
+        let ranges = rfc1918::GENERATED_CLASS_RANGES;
+        let mut used: [Vec<usize>; 3] = Default::default();
+        for index in self
+            .used_networks
+            .iter()
+            .filter_map(|&network| rfc1918::generated_network_index(network))
+        {
+            let class = ranges
+                .iter()
+                .position(|range| range.contains(&index))
+                .expect("Generated network indices fall in a class range");
+            used[class].push(index - ranges[class].start);
+        }
+        let free: [usize; 3] = std::array::from_fn(|class| ranges[class].len() - used[class].len());
+        if count > free.iter().sum::<usize>() {
+            return Err(VlanError::NetworkExhausted);
+        }
+
+        let mut class_counts = [0usize; 3];
+        for _ in 0..count {
+            let class = if self.rng.random_bool(0.8) {
+                0
+            } else if self.rng.random_bool(0.6) {
+                1
+            } else {
+                2
+            };
+            class_counts[class] += 1;
+        }
+        // A full class hands its surplus on, as redraws would one at a time
+        let mut surplus = 0;
+        for (class_count, &room) in class_counts.iter_mut().zip(&free) {
+            surplus += class_count.saturating_sub(room);
+            *class_count = (*class_count).min(room);
+        }
+        for (class_count, &room) in class_counts.iter_mut().zip(&free) {
+            let extra = surplus.min(room - *class_count);
+            *class_count += extra;
+            surplus -= extra;
+        }
+
+        let mut networks = Vec::with_capacity(count);
+        for ((range, mut used), class_count) in ranges.into_iter().zip(used).zip(class_counts) {
+            used.sort_unstable();
+
+            let room = range.len() - used.len();
+            let ranks = rand::seq::index::sample(&mut self.rng, room, class_count);
+            networks.extend(free_slots_by_rank(ranks, &used).map(|offset| {
+                rfc1918::generated_network(range.start + offset)
+                    .expect("Class range lies within the generated network space")
+            }));
+        }
+        // Interleave the classes so callers zipping with VLAN IDs get a mix
+        networks.shuffle(&mut self.rng);
+
+        Ok(networks)
+    }
+
     /// Generate unique VLAN ID
     fn generate_unique_vlan_id(&mut self, max_attempts: usize) -> Result<u16> {
+        // Once every ID is taken, retrying can only waste draws
+        if self.used_vlan_ids.len() >= VLAN_ID_COUNT {
+            return Err(ConfigError::resource_exhausted("VLAN IDs"));
+        }
+
         for _ in 0..max_attempts {
             let vlan_id = self.rng.random_range(10..=4094);
             if self.used_vlan_ids.insert(vlan_id) {
@@ -543,6 +798,10 @@ fn generate_unique_vlan_id(&mut self, max_attempts: usize) -> Result<u16> {
 
     /// Generate unique VLAN ID with enhanced error handling
     fn generate_unique_vlan_id_enhanced(&mut self, max_attempts: usize) -> VlanResult<u16> {
+        if self.used_vlan_ids.len() >= VLAN_ID_COUNT {
+            return Err(VlanError::VlanIdExhausted);
+        }
+
         for _ in 0..max_attempts {
             let vlan_id = self.rng.random_range(10..=4094);
             if self.used_vlan_ids.insert(vlan_id) {
@@ -556,13 +815,15 @@ fn generate_unique_vlan_id_enhanced(&mut self, max_attempts: usize) -> VlanResul
     /// Generate unique IP network
     pub fn generate_unique_ip_network(&mut self, max_attempts: usize) -> Result<String> {
         for _ in 0..max_attempts {
-            // Generate Class A private network (10.0.0.0/8)
-            let second_octet = self.rng.random_range(1..=254);
-            let third_octet = self.rng.random_range(1..=254);
-            let network = format!("10.{second_octet}.{third_octet}.x");
-
-            if self.used_networks.insert(network.clone()) {
-                return Ok(network);
+            // Generate Class A private network (10.0.0.0/8); the octets are
+            // drawn as i32 as before so seeded sequences are unchanged
+            let second_octet: i32 = self.rng.random_range(1..=254);
+            let third_octet: i32 = self.rng.random_range(1..=254);
+            let base = Ipv4Addr::new(10, second_octet as u8, third_octet as u8, 0);
+
+            // Only format the network once it is known to be unused
+            if self.used_networks.insert(base) {
+                return Ok(format!("10.{second_octet}.{third_octet}.x"));
             }
         }
 
@@ -581,8 +842,7 @@ fn generate_unique_rfc1918_network(&mut self, max_attempts: usize) -> VlanResult
                 rfc1918::generate_random_class_c_network(&mut self.rng)
             };
 
-            let network_key = network.to_string();
-            if self.used_networks.insert(network_key) {
+            if self.used_networks.insert(network.network()) {
                 return Ok(network);
             }
         }
@@ -612,13 +872,25 @@ pub fn generate_description(&mut self, vlan_id: u16) -> String {
         ];
 
         let department = DEPARTMENTS[self.rng.random_range(0..DEPARTMENTS.len())];
-        format!("{department} VLAN {vlan_id}")
+        departments::vlan_description(department, vlan_id)
     }
 
     /// Generate department-based description using new constants
     fn generate_description_enhanced(&mut self, vlan_id: u16) -> String {
         let department = departments::random_department(&mut self.rng);
-        format!("{department} VLAN {vlan_id}")
+        departments::vlan_description(department, vlan_id)
+    }
+}
+
+/// Number of generated VLANs between progress bar updates
+const PROGRESS_BATCH: u64 = 256;
+
+/// Update the progress bar every `PROGRESS_BATCH` items and on the last one
+fn report_progress(progress_bar: Option<&ProgressBar>, done: u64, total: u64) {
+    if let Some(pb) = progress_bar {
+        if done % PROGRESS_BATCH == 0 || done == total {
+            pb.set_position(done);
+        }
     }
 }
 
@@ -635,9 +907,7 @@ pub fn generate_vlan_configurations(
         let config = generator.generate_single()?;
         configs.push(config);
 
-        if let Some(pb) = progress_bar {
-            pb.set_position(i as u64 + 1);
-        }
+        report_progress(progress_bar, u64::from(i) + 1, u64::from(count));
     }
 
     Ok(configs)
@@ -650,15 +920,14 @@ pub fn generate_vlan_configurations_enhanced(
     progress_bar: Option<&ProgressBar>,
 ) -> VlanResult<Vec<VlanConfig>> {
     let mut generator = VlanGenerator::new(seed);
+    let (vlan_ids, networks) = generator.reserve_batch(count as usize)?;
     let mut configs = Vec::with_capacity(count as usize);
 
-    for i in 0..count {
-        let config = generator.generate_single_enhanced()?;
+    for (i, (vlan_id, network)) in vlan_ids.into_iter().zip(networks).enumerate() {
+        let config = generator.generate_enhanced_for(vlan_id, network)?;
         configs.push(config);
 
-        if let Some(pb) = progress_bar {
-            pb.set_position(i as u64 + 1);
-        }
+        report_progress(progress_bar, i as u64 + 1, u64::from(count));
     }
 
     Ok(configs)
@@ -695,9 +964,7 @@ pub fn generate_vlan_configurations_from_ranges(
             configs.push(config);
 
             processed += 1;
-            if let Some(pb) = progress_bar {
-                pb.set_position(processed);
-            }
+            report_progress(progress_bar, processed, u64::from(total_vlans));
         }
     }
 
@@ -742,9 +1009,7 @@ pub fn generate_vlan_configurations_from_ranges_with_wan(
 
             processed += 1;
             vlan_index += 1;
-            if let Some(pb) = progress_bar {
-                pb.set_position(processed);
-            }
+            report_progress(progress_bar, processed, u64::from(total_vlans));
         }
     }
 
@@ -770,12 +1035,10 @@ pub fn generate_vlan_configurations_with_wan(
         let wan_assignment =
             generator.generate_wan_assignment(wan_strategy, Some(i as usize), Some(count as usize));
 
-        let config = VlanConfig::new(vlan_id, ip_network, description, wan_assignment)?;
+        let config = VlanConfig::new_trusted(vlan_id, ip_network, description, wan_assignment);
         configs.push(config);
 
-        if let Some(pb) = progress_bar {
-            pb.set_position(i as u64 + 1);
-        }
+        report_progress(progress_bar, u64::from(i) + 1, u64::from(count));
     }
 
     Ok(configs)
@@ -1345,6 +1608,90 @@ fn test_vlan_generator_batch_enhanced() {
         }
     }
 
+    #[test]
+    fn test_batch_enhanced_covers_every_vlan_id() {
+        let mut generator = VlanGenerator::new(Some(42));
+        let first = generator.generate_single_enhanced().unwrap();
+
+        let (ids, _) = generator.reserve_batch(VLAN_ID_COUNT - 1).unwrap();
+        let unique: HashSet<u16> = ids.iter().copied().collect();
+        assert_eq!(unique.len(), VLAN_ID_COUNT - 1);
+        assert!(!unique.contains(&first.vlan_id));
+
+        assert!(matches!(
+            generator.reserve_batch(1),
+            Err(VlanError::VlanIdExhausted)
+        ));
+    }
+
+    #[test]
+    fn test_failed_batch_reserves_nothing() {
+        let mut generator = VlanGenerator::new(Some(42));
+        generator.used_networks.extend(
+            (0..rfc1918::GENERATED_NETWORK_COUNT)
+                .map(|index| rfc1918::generated_network(index).unwrap().network()),
+        );
+
+        assert!(matches!(
+            generator.generate_batch_enhanced(5),
+            Err(VlanError::NetworkExhausted)
+        ));
+        assert_eq!(generator.used_vlan_ids.len(), 0);
+    }
+
+    #[test]
+    fn test_sampled_networks_skip_used_ones() {
+        let mut generator = VlanGenerator::new(Some(42));
+        let first = generator.generate_single_enhanced().unwrap();
+
+        let networks = generator.sample_unused_networks(500).unwrap();
+        let unique: HashSet<Ipv4Network> = networks.iter().copied().collect();
+        assert_eq!(unique.len(), 500);
+        assert!(!unique.contains(&first.as_ipv4_network().unwrap()));
+        assert!(
+            generator
+                .sample_unused_networks(rfc1918::GENERATED_NETWORK_COUNT)
+                .is_err()
+        );
+    }
+
+    #[test]
+    fn test_sampled_networks_keep_class_weighting() {
+        let mut generator = VlanGenerator::new(Some(42));
+        let networks = generator.sample_unused_networks(2000).unwrap();
+
+        let mut class_counts = [0usize; 3];
+        for network in &networks {
+            match network.ip().octets()[0] {
+                10 => class_counts[0] += 1,
+                172 => class_counts[1] += 1,
+                192 => class_counts[2] += 1,
+                other => panic!("unexpected first octet {other}"),
+            }
+        }
+        assert!(class_counts.iter().all(|&count| count > 0));
+        assert!(class_counts[0] > class_counts[1] && class_counts[1] > class_counts[2]);
+    }
+
+    #[test]
+    fn test_sampled_networks_spill_past_a_full_class() {
+        let mut generator = VlanGenerator::new(Some(7));
+        generator.used_networks.extend(
+            rfc1918::GENERATED_CLASS_RANGES[2]
+                .clone()
+                .map(|index| rfc1918::generated_network(index).unwrap().network()),
+        );
+
+        let networks = generator.sample_unused_networks(4000).unwrap();
+        let unique: HashSet<Ipv4Network> = networks.iter().copied().collect();
+        assert_eq!(unique.len(), 4000);
+        assert!(
+            networks
+                .iter()
+                .all(|network| network.ip().octets()[0] != 192)
+        );
+    }
+
     #[test]
     fn test_vlan_generator_with_chacha_rng() {
         let mut gen1 = VlanGenerator::new(Some(12345));
@@ -1424,6 +1771,33 @@ fn test_memory_efficiency() {
         assert_eq!(networks.len(), 100);
     }
 
+    #[test]
+    fn test_enhanced_seeded_output_is_stable() {
+        let configs = generate_vlan_configurations_enhanced(5, Some(42), None).unwrap();
+        let actual: Vec<(u16, &str, &str, u8)> = configs
+            .iter()
+            .map(|config| {
+                (
+                    config.vlan_id,
+                    config.ip_network.as_str(),
+                    config.description.as_str(),
+                    config.wan_assignment,
+                )
+            })
+            .collect();
+
+        assert_eq!(
+            actual,
+            [
+                (924, "10.61.153.x", "Security VLAN 924", 2),
+                (2793, "10.210.163.x", "Logistics VLAN 2793", 2),
+                (607, "10.205.44.x", "Production VLAN 607", 3),
+                (3890, "10.196.227.x", "Development VLAN 3890", 3),
+                (3164, "10.160.138.x", "Training VLAN 3164", 1),
+            ]
+        );
+    }
+
     #[test]
     fn test_enhanced_public_api() {
         use crate::generator::vlan::generate_vlan_configurations_enhanced;
@@ -1589,6 +1963,23 @@ fn test_dhcp_domain_name_department_specific() {
         assert_eq!(sales_config.dhcp_domain_name(), "sales.company.local");
     }
 
+    #[test]
+    fn test_host_addresses() {
+        let config =
+            VlanConfig::new(100, "10.1.2.x".to_string(), "IT VLAN 100".to_string(), 1).unwrap();
+        let hosts = config.host_addresses().unwrap();
+
+        assert_eq!(hosts.gateway, config.gateway_ip().unwrap());
+        assert_eq!(hosts.dhcp_start, config.dhcp_range_start().unwrap());
+        assert_eq!(hosts.dhcp_end, config.dhcp_range_end().unwrap());
+
+        let invalid = VlanConfig {
+            ip_network: "bogus".to_string(),
+            ..config
+        };
+        assert!(invalid.host_addresses().is_err());
+    }
+
     #[test]
     fn test_dhcp_dns_servers() {
         let config = VlanConfig::new(100, "10.1.2.x".to_string(), "IT 100".to_string(), 1).unwrap();
@@ -1649,4 +2040,75 @@ fn test_dhcp_server_config_complete() {
         assert!(dhcp_config.ntp_servers.len() >= 3);
         assert!(dhcp_config.static_reservations.len() >= 2);
     }
+
+    #[test]
+    fn test_new_trusted_matches_new() {
+        let trusted = VlanConfig::new_trusted(100, "10.1.2.x".to_string(), "Test".to_string(), 2);
+        let checked = VlanConfig::new(100, "10.1.2.x".to_string(), "Test".to_string(), 2).unwrap();
+        assert_eq!(trusted, checked);
+    }
+
+    #[test]
+    fn test_network_prefix() {
+        let config = VlanConfig::new(100, "10.1.2.x".to_string(), "IT 100".to_string(), 1).unwrap();
+        assert_eq!(config.network_prefix(), Some("10.1.2"));
+
+        let cidr =
+            VlanConfig::new(100, "10.1.2.0/24".to_string(), "IT 100".to_string(), 1).unwrap();
+        assert_eq!(cidr.network_prefix(), Some("10.1.2"));
+
+        let mut invalid = config.clone();
+        invalid.ip_network = "invalid".to_string();
+        assert_eq!(invalid.network_prefix(), None);
+        assert!(invalid.gateway_ip().is_err());
+    }
+
+    #[test]
+    fn test_vlan_id_set_tracks_membership() {
+        let mut set = VlanIdSet::new();
+        assert!(set.insert(10));
+        assert!(set.insert(4094));
+        assert!(!set.insert(10));
+        assert_eq!(set.iter().collect::<Vec<_>>(), vec![10, 4094]);
+        assert_eq!(set.len(), 2);
+
+        set.extend(10..=4094);
+        assert_eq!(set.len(), VLAN_ID_COUNT);
+        assert!(set.iter().eq(10..=4094));
+    }
+
+    #[test]
+    fn test_sampled_vlan_ids_skip_used_ones() {
+        let mut generator = VlanGenerator::new(Some(42));
+        generator.used_vlan_ids.extend((10..=4094).step_by(2));
+
+        let ids = generator.sample_unused_vlan_ids(2042).unwrap();
+        let unique: HashSet<u16> = ids.iter().copied().collect();
+        assert_eq!(unique.len(), 2042);
+        assert!(ids.iter().all(|id| (11..=4093).contains(id) && id % 2 == 1));
+        assert!(generator.sample_unused_vlan_ids(2043).is_err());
+    }
+
+    #[test]
+    fn test_unique_vlan_id_fails_fast_when_exhausted() {
+        let mut generator = VlanGenerator::new(Some(42));
+        generator.used_vlan_ids.extend(10..=4094);
+
+        assert!(generator.generate_unique_vlan_id(1000).is_err());
+        assert!(matches!(
+            generator.generate_unique_vlan_id_enhanced(1000),
+            Err(VlanError::VlanIdExhausted)
+        ));
+    }
+
+    #[test]
+    fn test_batched_progress_reaches_total() {
+        let pb = ProgressBar::hidden();
+        pb.set_length(300);
+
+        let configs = generate_vlan_configurations(300, Some(42), Some(&pb)).unwrap();
+
+        assert_eq!(configs.len(), 300);
+        assert_eq!(pb.position(), 300);
+    }
 }
@@ -1,73 +1,30 @@
 //! CSV input/output operations
 
 use crate::Result;
+use crate::generator::firewall::{VALID_ACTIONS, VALID_DIRECTIONS, VALID_PROTOCOLS, is_one_of};
 use crate::generator::{FirewallRule, VlanConfig};
-use csv::{Reader, Writer, WriterBuilder};
-use lazy_static::lazy_static;
+use csv::{Reader, StringRecord, WriterBuilder};
+use serde::de::DeserializeOwned;
 use serde::{Deserialize, Serialize};
-use std::collections::HashSet;
 use std::fs::File;
-use std::io::{BufReader, BufWriter};
+use std::io::BufReader;
 use std::path::Path;
 
+/// Buffer size for CSV file writers
+///
+/// The csv writer buffers internally, so a single large buffer replaces the
+/// default 8 KiB one plus an extra `BufWriter` layer.
+const WRITE_BUFFER_CAPACITY: usize = 1 << 20;
+
 // CSV header field name constants
 #[allow(dead_code)]
 const FIELD_VLAN: &str = "VLAN";
-
-// Lazy static validation sets for O(1) membership tests
-lazy_static! {
-    static ref VALID_ACTIONS: HashSet<&'static str> = {
-        let mut set = HashSet::new();
-        set.insert("pass");
-        set.insert("block");
-        set.insert("reject");
-        set
-    };
-    static ref VALID_DIRECTIONS: HashSet<&'static str> = {
-        let mut set = HashSet::new();
-        set.insert("in");
-        set.insert("out");
-        set
-    };
-    static ref VALID_PROTOCOLS: HashSet<&'static str> = {
-        let mut set = HashSet::new();
-        set.insert("tcp");
-        set.insert("udp");
-        set.insert("icmp");
-        set.insert("any");
-        set
-    };
-}
 #[allow(dead_code)]
 const FIELD_IP_RANGE: &str = "IP Range";
 #[allow(dead_code)]
 const FIELD_BESCHREIBUNG: &str = "Beschreibung";
 #[allow(dead_code)]
 const FIELD_WAN: &str = "WAN";
-#[allow(dead_code)]
-const FIELD_RULE_ID: &str = "rule_id";
-#[allow(dead_code)]
-const FIELD_SOURCE: &str = "source";
-#[allow(dead_code)]
-const FIELD_DESTINATION: &str = "destination";
-#[allow(dead_code)]
-const FIELD_PROTOCOL: &str = "protocol";
-#[allow(dead_code)]
-const FIELD_PORTS: &str = "ports";
-#[allow(dead_code)]
-const FIELD_ACTION: &str = "action";
-#[allow(dead_code)]
-const FIELD_DIRECTION: &str = "direction";
-#[allow(dead_code)]
-const FIELD_DESCRIPTION: &str = "description";
-#[allow(dead_code)]
-const FIELD_LOG: &str = "log";
-#[allow(dead_code)]
-const FIELD_VLAN_ID: &str = "vlan_id";
-#[allow(dead_code)]
-const FIELD_PRIORITY: &str = "priority";
-#[allow(dead_code)]
-const FIELD_INTERFACE: &str = "interface";
 
 /// Construct the CSV header string for VLAN records
 #[allow(dead_code)]
@@ -105,6 +62,35 @@ fn from(config: &VlanConfig) -> Self {
     }
 }
 
+/// Borrowed view of a VLAN row, so writing never clones its strings
+///
+/// Serializes to the same columns as `CsvRecord`.
+#[derive(Serialize)]
+struct CsvRecordRef<'a> {
+    #[serde(rename = "VLAN")]
+    vlan_id: u16,
+
+    #[serde(rename = "IP Range")]
+    ip_range: &'a str,
+
+    #[serde(rename = "Beschreibung")]
+    description: &'a str,
+
+    #[serde(rename = "WAN")]
+    wan_assignment: u8,
+}
+
+impl<'a> From<&'a VlanConfig> for CsvRecordRef<'a> {
+    fn from(config: &'a VlanConfig) -> Self {
+        Self {
+            vlan_id: config.vlan_id,
+            ip_range: &config.ip_network,
+            description: &config.description,
+            wan_assignment: config.wan_assignment,
+        }
+    }
+}
+
 impl From<CsvRecord> for VlanConfig {
     fn from(record: CsvRecord) -> Self {
         // Note: This bypasses validation for CSV compatibility
@@ -119,15 +105,36 @@ fn from(record: CsvRecord) -> Self {
     }
 }
 
+/// Deserialize every data row of `reader`, reusing a single record buffer
+///
+/// `Reader::deserialize` allocates a fresh record per row; reading into one
+/// `StringRecord` amortizes that allocation across the whole file.
+fn for_each_record<R, T, F>(reader: &mut Reader<R>, mut handle: F) -> Result<()>
+where
+    R: std::io::Read,
+    T: DeserializeOwned,
+    F: FnMut(T) -> Result<()>,
+{
+    let headers = reader.headers()?.clone();
+    let mut record = StringRecord::new();
+
+    while reader.read_record(&mut record)? {
+        handle(record.deserialize(Some(&headers))?)?;
+    }
+
+    Ok(())
+}
+
 /// Write VLAN configurations to a CSV file
 pub fn write_csv<P: AsRef<Path>>(configs: &[VlanConfig], path: P) -> Result<()> {
     let file = File::create(path)?;
-    let mut writer = Writer::from_writer(BufWriter::new(file));
+    let mut writer = WriterBuilder::new()
+        .buffer_capacity(WRITE_BUFFER_CAPACITY)
+        .from_writer(file);
 
     // Write header and records
     for config in configs {
-        let record = CsvRecord::from(config);
-        writer.serialize(record)?;
+        writer.serialize(CsvRecordRef::from(config))?;
     }
 
     writer.flush()?;
@@ -140,10 +147,10 @@ pub fn read_csv<P: AsRef<Path>>(path: P) -> Result<Vec<VlanConfig>> {
     let mut reader = Reader::from_reader(BufReader::new(file));
     let mut configs = Vec::new();
 
-    for result in reader.deserialize() {
-        let record: CsvRecord = result?;
+    for_each_record(&mut reader, |record: CsvRecord| {
         configs.push(VlanConfig::from(record));
-    }
+        Ok(())
+    })?;
 
     Ok(configs)
 }
@@ -254,6 +261,42 @@ fn from(rule: &FirewallRule) -> Self {
     }
 }
 
+/// Borrowed view of a firewall rule row, serialized like `FirewallRuleCsvRecord`
+#[derive(Serialize)]
+struct FirewallRuleCsvRecordRef<'a> {
+    rule_id: &'a str,
+    source: &'a str,
+    destination: &'a str,
+    protocol: &'a str,
+    ports: &'a str,
+    action: &'a str,
+    direction: &'a str,
+    description: &'a str,
+    log: bool,
+    vlan_id: Option<u16>,
+    priority: u16,
+    interface: &'a str,
+}
+
+impl<'a> From<&'a FirewallRule> for FirewallRuleCsvRecordRef<'a> {
+    fn from(rule: &'a FirewallRule) -> Self {
+        Self {
+            rule_id: &rule.rule_id,
+            source: &rule.source,
+            destination: &rule.destination,
+            protocol: &rule.protocol,
+            ports: &rule.ports,
+            action: &rule.action,
+            direction: &rule.direction,
+            description: &rule.description,
+            log: rule.log,
+            vlan_id: rule.vlan_id,
+            priority: rule.priority,
+            interface: &rule.interface,
+        }
+    }
+}
+
 impl From<FirewallRuleCsvRecord> for FirewallRule {
     fn from(record: FirewallRuleCsvRecord) -> Self {
         // Note: This bypasses validation for CSV compatibility
@@ -279,7 +322,8 @@ pub fn write_firewall_rules_csv<P: AsRef<Path>>(rules: &[FirewallRule], path: P)
     let file = File::create(path)?;
     let mut writer = WriterBuilder::new()
         .has_headers(false)
-        .from_writer(BufWriter::new(file));
+        .buffer_capacity(WRITE_BUFFER_CAPACITY)
+        .from_writer(file);
 
     // Write header row with exact column names
     writer.write_record([
@@ -299,8 +343,7 @@ pub fn write_firewall_rules_csv<P: AsRef<Path>>(rules: &[FirewallRule], path: P)
 
     // Write records
     for rule in rules {
-        let record = FirewallRuleCsvRecord::from(rule);
-        writer.serialize(record)?;
+        writer.serialize(FirewallRuleCsvRecordRef::from(rule))?;
     }
 
     writer.flush()?;
@@ -313,10 +356,10 @@ pub fn read_firewall_rules_csv<P: AsRef<Path>>(path: P) -> Result<Vec<FirewallRu
     let mut reader = Reader::from_reader(BufReader::new(file));
     let mut rules = Vec::new();
 
-    for result in reader.deserialize() {
-        let record: FirewallRuleCsvRecord = result?;
+    for_each_record(&mut reader, |record: FirewallRuleCsvRecord| {
         rules.push(FirewallRule::from(record));
-    }
+        Ok(())
+    })?;
 
     Ok(rules)
 }
@@ -356,38 +399,27 @@ pub fn read_firewall_rules_csv_validated<P: AsRef<Path>>(path: P) -> Result<Vec<
             )));
         }
 
-        // Pre-compute lowercase strings once per record for efficient validation
-        let action_lower = rule.action.to_lowercase();
-        let direction_lower = rule.direction.to_lowercase();
-        let protocol_lower = rule.protocol.to_lowercase();
-
-        // Validate action using O(1) HashSet lookup
-        if !VALID_ACTIONS.contains(action_lower.as_str()) {
+        // Validate action against the compile-time table without allocating
+        if !is_one_of(&rule.action, VALID_ACTIONS) {
             return Err(crate::model::ConfigError::validation(format!(
                 "Invalid action '{}' at line {}: must be one of {:?}",
-                rule.action,
-                line_number,
-                VALID_ACTIONS.iter().collect::<Vec<_>>()
+                rule.action, line_number, VALID_ACTIONS
             )));
         }
 
-        // Validate direction using O(1) HashSet lookup
-        if !VALID_DIRECTIONS.contains(direction_lower.as_str()) {
+        // Validate direction against the compile-time table without allocating
+        if !is_one_of(&rule.direction, VALID_DIRECTIONS) {
             return Err(crate::model::ConfigError::validation(format!(
                 "Invalid direction '{}' at line {}: must be one of {:?}",
-                rule.direction,
-                line_number,
-                VALID_DIRECTIONS.iter().collect::<Vec<_>>()
+                rule.direction, line_number, VALID_DIRECTIONS
             )));
         }
 
-        // Validate protocol using O(1) HashSet lookup
-        if !VALID_PROTOCOLS.contains(protocol_lower.as_str()) {
+        // Validate protocol against the compile-time table without allocating
+        if !is_one_of(&rule.protocol, VALID_PROTOCOLS) {
             return Err(crate::model::ConfigError::validation(format!(
                 "Invalid protocol '{}' at line {}: must be one of {:?}",
-                rule.protocol,
-                line_number,
-                VALID_PROTOCOLS.iter().collect::<Vec<_>>()
+                rule.protocol, line_number, VALID_PROTOCOLS
             )));
         }
 
@@ -406,12 +438,11 @@ pub fn read_csv_streaming<P: AsRef<Path>, F>(path: P, mut callback: F) -> Result
     let mut reader = Reader::from_reader(BufReader::new(file));
     let mut count = 0;
 
-    for result in reader.deserialize() {
-        let record: CsvRecord = result?;
-        let config = VlanConfig::from(record);
-        callback(config)?;
+    for_each_record(&mut reader, |record: CsvRecord| {
+        callback(VlanConfig::from(record))?;
         count += 1;
-    }
+        Ok(())
+    })?;
 
     Ok(count)
 }
@@ -423,12 +454,13 @@ pub fn write_csv_streaming<P, I>(configs: I, path: P) -> Result<usize>
     P: AsRef<Path>,
 {
     let file = File::create(path)?;
-    let mut writer = Writer::from_writer(BufWriter::new(file));
+    let mut writer = WriterBuilder::new()
+        .buffer_capacity(WRITE_BUFFER_CAPACITY)
+        .from_writer(file);
     let mut count = 0;
 
     for config in configs {
-        let record = CsvRecord::from(&config);
-        writer.serialize(record)?;
+        writer.serialize(CsvRecordRef::from(&config))?;
         count += 1;
     }
 
@@ -493,6 +525,40 @@ fn test_csv_header_exact() {
         assert_eq!(first_line, vlan_csv_header());
     }
 
+    #[test]
+    fn test_borrowed_records_serialize_like_owned() {
+        let config =
+            VlanConfig::new(42, "10.1.2.x".to_string(), "IT, \"Ops\"".to_string(), 2).unwrap();
+        let mut owned = csv::Writer::from_writer(Vec::new());
+        owned.serialize(CsvRecord::from(&config)).unwrap();
+        let mut borrowed = csv::Writer::from_writer(Vec::new());
+        borrowed.serialize(CsvRecordRef::from(&config)).unwrap();
+        assert_eq!(owned.into_inner().unwrap(), borrowed.into_inner().unwrap());
+
+        let rule = FirewallRule::new(
+            "fw-1".to_string(),
+            "10.1.2.0/24".to_string(),
+            "any".to_string(),
+            "tcp".to_string(),
+            "80,443".to_string(),
+            "pass".to_string(),
+            "in".to_string(),
+            "Web".to_string(),
+            false,
+            None,
+            7,
+            "opt1".to_string(),
+        )
+        .unwrap();
+        let mut owned = csv::Writer::from_writer(Vec::new());
+        owned.serialize(FirewallRuleCsvRecord::from(&rule)).unwrap();
+        let mut borrowed = csv::Writer::from_writer(Vec::new());
+        borrowed
+            .serialize(FirewallRuleCsvRecordRef::from(&rule))
+            .unwrap();
+        assert_eq!(owned.into_inner().unwrap(), borrowed.into_inner().unwrap());
+    }
+
     #[test]
     fn test_csv_validated_reading() {
         let configs = vec![
@@ -733,7 +799,7 @@ fn test_large_dataset_memory_efficiency() {
 
     #[test]
     fn test_firewall_rule_validation_performance() {
-        // Test that the HashSet-based validation works correctly and efficiently
+        // Test that the table-based validation works correctly and efficiently
         let temp_file = NamedTempFile::new().unwrap();
         let mut csv_content = String::from(
             "rule_id,source,destination,protocol,ports,action,direction,description,log,vlan_id,priority,interface\n",
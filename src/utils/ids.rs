@@ -0,0 +1,92 @@
+//! Random identifier helpers for generated configuration records
+
+use rand::RngCore;
+use uuid::{Builder, Uuid};
+
+/// Random version 4 UUID drawn from the thread-local generator
+///
+/// `Uuid::new_v4` asks the operating system for entropy on every call. The
+/// thread-local generator is seeded from the OS once and reseeds itself, so
+/// bulk record generation no longer costs a syscall per identifier.
+pub fn random_uuid() -> Uuid {
+    uuid_from_rng(&mut rand::rng())
+}
+
+/// Version 4 UUID drawn from a caller-owned generator
+///
+/// Seeded generators use this so the identifiers they mint are reproducible
+/// along with the rest of their output.
+pub fn uuid_from_rng<R: RngCore + ?Sized>(rng: &mut R) -> Uuid {
+    let mut bytes = [0u8; 16];
+    rng.fill_bytes(&mut bytes);
+    Builder::from_random_bytes(bytes).into_uuid()
+}
+
+/// Random version 4 UUID in lowercase hyphenated form
+///
+/// Encodes into a stack buffer instead of going through the `Display`
+/// formatter.
+pub fn random_uuid_string() -> String {
+    random_uuid()
+        .hyphenated()
+        .encode_lower(&mut Uuid::encode_buffer())
+        .to_owned()
+}
+
+/// First hyphen-delimited group of a random UUID (8 lowercase hex digits)
+///
+/// Reads the typed UUID fields directly instead of formatting the full
+/// hyphenated string and splitting it.
+pub fn short_uuid() -> String {
+    short_uuid_from_rng(&mut rand::rng())
+}
+
+/// [`short_uuid`] drawn from a caller-owned generator
+pub fn short_uuid_from_rng<R: RngCore + ?Sized>(rng: &mut R) -> String {
+    format!("{:08x}", uuid_from_rng(rng).as_fields().0)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_random_uuid_is_version_4() {
+        let id = random_uuid();
+        assert_eq!(id.get_version_num(), 4);
+        assert_ne!(id, random_uuid());
+    }
+
+    #[test]
+    fn test_random_uuid_string_is_canonical() {
+        let id = random_uuid_string();
+        let parsed = Uuid::parse_str(&id).unwrap();
+        assert_eq!(parsed.to_string(), id);
+        assert_eq!(parsed.get_version_num(), 4);
+    }
+
+    #[test]
+    fn test_uuid_from_rng_is_reproducible() {
+        use rand::SeedableRng;
+        use rand_chacha::ChaCha8Rng;
+
+        let first = uuid_from_rng(&mut ChaCha8Rng::seed_from_u64(7));
+        let second = uuid_from_rng(&mut ChaCha8Rng::seed_from_u64(7));
+        assert_eq!(first, second);
+        assert_eq!(first.get_version_num(), 4);
+        assert_eq!(
+            short_uuid_from_rng(&mut ChaCha8Rng::seed_from_u64(7)),
+            format!("{:08x}", first.as_fields().0)
+        );
+    }
+
+    #[test]
+    fn test_short_uuid_format() {
+        let id = short_uuid();
+        assert_eq!(id.len(), 8);
+        assert!(
+            id.chars()
+                .all(|c| c.is_ascii_hexdigit() && !c.is_ascii_uppercase())
+        );
+    }
+}
@@ -1,3 +1,4 @@
 //! Utility functions for network operations
 
+pub mod ids;
 pub mod rfc1918;
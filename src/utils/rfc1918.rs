@@ -3,6 +3,7 @@
 use crate::model::{VlanError, VlanResult};
 use ipnetwork::Ipv4Network;
 use std::net::Ipv4Addr;
+use std::ops::Range;
 
 /// RFC 1918 private address ranges
 pub struct Rfc1918Ranges {
@@ -14,25 +15,28 @@ pub struct Rfc1918Ranges {
     pub class_c: (Ipv4Addr, Ipv4Addr),
 }
 
+/// The RFC 1918 ranges; every instance is identical, so share this one
+pub const RFC1918_RANGES: Rfc1918Ranges = Rfc1918Ranges {
+    class_a: (Ipv4Addr::new(10, 0, 0, 0), Ipv4Addr::new(10, 255, 255, 255)),
+    class_b: (
+        Ipv4Addr::new(172, 16, 0, 0),
+        Ipv4Addr::new(172, 31, 255, 255),
+    ),
+    class_c: (
+        Ipv4Addr::new(192, 168, 0, 0),
+        Ipv4Addr::new(192, 168, 255, 255),
+    ),
+};
+
 impl Default for Rfc1918Ranges {
     fn default() -> Self {
-        Self {
-            class_a: (Ipv4Addr::new(10, 0, 0, 0), Ipv4Addr::new(10, 255, 255, 255)),
-            class_b: (
-                Ipv4Addr::new(172, 16, 0, 0),
-                Ipv4Addr::new(172, 31, 255, 255),
-            ),
-            class_c: (
-                Ipv4Addr::new(192, 168, 0, 0),
-                Ipv4Addr::new(192, 168, 255, 255),
-            ),
-        }
+        RFC1918_RANGES
     }
 }
 
 /// Check if an IPv4 address is within RFC 1918 private address space
 pub fn is_rfc1918_addr(addr: Ipv4Addr) -> bool {
-    let ranges = Rfc1918Ranges::default();
+    let ranges = &RFC1918_RANGES;
 
     // Check Class A (10.0.0.0/8)
     if addr >= ranges.class_a.0 && addr <= ranges.class_a.1 {
@@ -79,8 +83,7 @@ pub fn validate_rfc1918_network_string(network_str: &str) -> VlanResult<Ipv4Netw
 /// Convert a "10.x.x.x" format string to a proper RFC 1918 network
 pub fn convert_x_format_to_network(x_format: &str) -> VlanResult<Ipv4Network> {
     if let Some(base) = x_format.strip_suffix(".x") {
-        let network_str = format!("{base}.0/24");
-        validate_rfc1918_network_string(&network_str)
+        network_from_prefix(base)
     } else {
         Err(VlanError::network_parsing(format!(
             "Invalid x format: {x_format}"
@@ -88,44 +91,167 @@ pub fn convert_x_format_to_network(x_format: &str) -> VlanResult<Ipv4Network> {
     }
 }
 
+/// Build the RFC 1918 /24 network for a three-octet prefix such as "10.1.2"
+///
+/// Octets are parsed straight from the prefix bytes, avoiding the
+/// format-then-parse round trip through a CIDR string.
+pub fn network_from_prefix(prefix: &str) -> VlanResult<Ipv4Network> {
+    let [a, b, c] = parse_network_prefix(prefix).ok_or_else(|| {
+        VlanError::network_parsing(format!("Failed to parse '{prefix}.0/24': invalid octets"))
+    })?;
+    let network = Ipv4Network::new(Ipv4Addr::new(a, b, c, 0), 24)
+        .map_err(|e| VlanError::network_parsing(format!("Failed to parse '{prefix}.0/24': {e}")))?;
+
+    if !is_rfc1918_network(&network) {
+        return Err(VlanError::NonRfc1918Network(format!("{prefix}.0/24")));
+    }
+
+    Ok(network)
+}
+
+/// Parse a dotted three-octet prefix such as "10.1.2" without allocating
+pub fn parse_network_prefix(prefix: &str) -> Option<[u8; 3]> {
+    let mut parts = prefix.split('.');
+    let mut octets = [0u8; 3];
+    for octet in &mut octets {
+        *octet = parse_octet(parts.next()?)?;
+    }
+    parts.next().is_none().then_some(octets)
+}
+
+/// Parse a decimal octet of one to three ASCII digits
+///
+/// Leading zeros are rejected to match `Ipv4Addr`'s parser.
+fn parse_octet(digits: &str) -> Option<u8> {
+    let bytes = digits.as_bytes();
+    if bytes.is_empty() || bytes.len() > 3 || (bytes.len() > 1 && bytes[0] == b'0') {
+        return None;
+    }
+
+    let mut value: u16 = 0;
+    for &byte in bytes {
+        let digit = byte.wrapping_sub(b'0');
+        if digit > 9 {
+            return None;
+        }
+        value = value * 10 + u16::from(digit);
+    }
+    u8::try_from(value).ok()
+}
+
 /// Generate a random RFC 1918 Class A network (10.x.y.0/24)
 pub fn generate_random_class_a_network<R: rand::Rng>(rng: &mut R) -> Ipv4Network {
-    let second_octet = rng.random_range(1..=254);
-    let third_octet = rng.random_range(1..=254);
+    // Octets are drawn as i32 so seeded sequences stay the same
+    let second_octet: i32 = rng.random_range(1..=254);
+    let third_octet: i32 = rng.random_range(1..=254);
 
-    // This is guaranteed to be RFC 1918 compliant
-    format!("10.{second_octet}.{third_octet}.0/24")
-        .parse()
-        .expect("Generated network should be valid")
+    slash24(10, second_octet as u8, third_octet as u8)
 }
 
 /// Generate a random RFC 1918 Class B network (172.16-31.x.0/24)
 pub fn generate_random_class_b_network<R: rand::Rng>(rng: &mut R) -> Ipv4Network {
-    let second_octet = rng.random_range(16..=31);
-    let third_octet = rng.random_range(1..=254);
+    let second_octet: i32 = rng.random_range(16..=31);
+    let third_octet: i32 = rng.random_range(1..=254);
 
-    // This is guaranteed to be RFC 1918 compliant
-    format!("172.{second_octet}.{third_octet}.0/24")
-        .parse()
-        .expect("Generated network should be valid")
+    slash24(172, second_octet as u8, third_octet as u8)
 }
 
 /// Generate a random RFC 1918 Class C network (192.168.x.0/24)
 pub fn generate_random_class_c_network<R: rand::Rng>(rng: &mut R) -> Ipv4Network {
-    let third_octet = rng.random_range(1..=254);
+    let third_octet: i32 = rng.random_range(1..=254);
+
+    slash24(192, 168, third_octet as u8)
+}
+
+/// Number of 10.x.y.0/24 networks in the generators' key space
+const CLASS_A: usize = 254 * 254;
+
+/// Number of 172.16-31.x.0/24 networks in the generators' key space
+const CLASS_B: usize = 16 * 254;
+
+/// Number of distinct /24 networks the random class generators can produce
+pub const GENERATED_NETWORK_COUNT: usize = CLASS_A + CLASS_B + 254;
+
+/// Index ranges of `generated_network` covering Class A, B and C, in that order
+pub const GENERATED_CLASS_RANGES: [Range<usize>; 3] = [
+    0..CLASS_A,
+    CLASS_A..CLASS_A + CLASS_B,
+    CLASS_A + CLASS_B..GENERATED_NETWORK_COUNT,
+];
+
+/// The `index`-th /24 network of the generators' combined key space
+///
+/// Indices run through 10.1-254.1-254, then 172.16-31.1-254, then
+/// 192.168.1-254, so sampling distinct indices yields distinct networks
+/// without any collision retries. Returns `None` past
+/// `GENERATED_NETWORK_COUNT`.
+pub fn generated_network(index: usize) -> Option<Ipv4Network> {
+    let (a, b, rest) = if index < CLASS_A {
+        (10, 1 + index / 254, index % 254)
+    } else if index < CLASS_A + CLASS_B {
+        let offset = index - CLASS_A;
+        (172, 16 + offset / 254, offset % 254)
+    } else if index < GENERATED_NETWORK_COUNT {
+        (192, 168, index - CLASS_A - CLASS_B)
+    } else {
+        return None;
+    };
+
+    Some(slash24(a, b as u8, rest as u8 + 1))
+}
+
+/// Inverse of `generated_network` for a /24 network address
+///
+/// Returns `None` for addresses the random class generators never produce.
+pub fn generated_network_index(network: Ipv4Addr) -> Option<usize> {
+    let [a, b, c, _] = network.octets();
+    if !(1..=254).contains(&c) {
+        return None;
+    }
+    let rest = usize::from(c - 1);
+
+    match (a, b) {
+        (10, 1..=254) => Some(usize::from(b - 1) * 254 + rest),
+        (172, 16..=31) => Some(CLASS_A + usize::from(b - 16) * 254 + rest),
+        (192, 168) => Some(CLASS_A + CLASS_B + rest),
+        _ => None,
+    }
+}
 
-    // This is guaranteed to be RFC 1918 compliant
-    format!("192.168.{third_octet}.0/24")
-        .parse()
-        .expect("Generated network should be valid")
+/// Build the /24 network for three octets without a string round trip
+fn slash24(a: u8, b: u8, c: u8) -> Ipv4Network {
+    Ipv4Network::new(Ipv4Addr::new(a, b, c, 0), 24).expect("A /24 prefix is always valid")
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
-    use rand::SeedableRng;
+    use rand::{Rng, SeedableRng};
     use rand_chacha::ChaCha8Rng;
 
+    #[test]
+    fn test_parse_network_prefix() {
+        assert_eq!(parse_network_prefix("10.1.2"), Some([10, 1, 2]));
+        assert_eq!(parse_network_prefix("192.168.255"), Some([192, 168, 255]));
+        assert_eq!(parse_network_prefix("10.1"), None);
+        assert_eq!(parse_network_prefix("10.1.2.3"), None);
+        assert_eq!(parse_network_prefix("10..2"), None);
+        assert_eq!(parse_network_prefix("10.256.2"), None);
+        assert_eq!(parse_network_prefix("10.01.2"), None);
+        assert_eq!(parse_network_prefix("10.a.2"), None);
+    }
+
+    #[test]
+    fn test_network_from_prefix() {
+        let network = network_from_prefix("172.16.5").unwrap();
+        assert_eq!(network.network(), Ipv4Addr::new(172, 16, 5, 0));
+        assert_eq!(network.prefix(), 24);
+        assert!(matches!(
+            network_from_prefix("8.8.8"),
+            Err(VlanError::NonRfc1918Network(_))
+        ));
+    }
+
     #[test]
     fn test_rfc1918_addr_validation() {
         // Valid RFC 1918 addresses
@@ -241,6 +367,56 @@ fn test_random_network_generation() {
         }
     }
 
+    #[test]
+    fn test_random_networks_match_string_construction() {
+        let mut rng = ChaCha8Rng::seed_from_u64(7);
+        let mut expected_rng = ChaCha8Rng::seed_from_u64(7);
+
+        for _ in 0..20 {
+            let network = generate_random_class_a_network(&mut rng);
+            let second: i32 = expected_rng.random_range(1..=254);
+            let third: i32 = expected_rng.random_range(1..=254);
+            let expected: Ipv4Network = format!("10.{second}.{third}.0/24").parse().unwrap();
+            assert_eq!(network, expected);
+        }
+    }
+
+    #[test]
+    fn test_generated_network_space_is_distinct() {
+        let networks: std::collections::HashSet<Ipv4Network> = (0..GENERATED_NETWORK_COUNT)
+            .map(|index| generated_network(index).unwrap())
+            .collect();
+        assert_eq!(networks.len(), GENERATED_NETWORK_COUNT);
+        assert!(networks.iter().all(is_rfc1918_network));
+
+        assert_eq!(generated_network(0), Some(slash24(10, 1, 1)));
+        assert_eq!(
+            generated_network(GENERATED_NETWORK_COUNT - 1),
+            Some(slash24(192, 168, 254))
+        );
+        assert_eq!(generated_network(GENERATED_NETWORK_COUNT), None);
+    }
+
+    #[test]
+    fn test_generated_network_index_round_trips() {
+        for index in 0..GENERATED_NETWORK_COUNT {
+            let network = generated_network(index).unwrap();
+            assert_eq!(generated_network_index(network.network()), Some(index));
+        }
+
+        for (mut range, first_octet) in GENERATED_CLASS_RANGES.into_iter().zip([10, 172, 192]) {
+            assert!(
+                range
+                    .all(|index| generated_network(index).unwrap().ip().octets()[0] == first_octet)
+            );
+        }
+
+        assert_eq!(generated_network_index(Ipv4Addr::new(10, 0, 1, 0)), None);
+        assert_eq!(generated_network_index(Ipv4Addr::new(172, 32, 1, 0)), None);
+        assert_eq!(generated_network_index(Ipv4Addr::new(192, 168, 0, 0)), None);
+        assert_eq!(generated_network_index(Ipv4Addr::new(8, 8, 8, 0)), None);
+    }
+
     #[test]
     fn test_class_ranges() {
         let ranges = Rfc1918Ranges::default();
@@ -257,4 +433,12 @@ fn test_class_ranges() {
         assert_eq!(ranges.class_c.0, Ipv4Addr::new(192, 168, 0, 0));
         assert_eq!(ranges.class_c.1, Ipv4Addr::new(192, 168, 255, 255));
     }
+
+    #[test]
+    fn test_default_matches_shared_ranges() {
+        let ranges = Rfc1918Ranges::default();
+        assert_eq!(ranges.class_a, RFC1918_RANGES.class_a);
+        assert_eq!(ranges.class_b, RFC1918_RANGES.class_b);
+        assert_eq!(ranges.class_c, RFC1918_RANGES.class_c);
+    }
 }
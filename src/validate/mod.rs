@@ -22,6 +22,12 @@ pub fn new() -> Self {
 
     /// Validate a single VLAN configuration
     pub fn validate_config(&mut self, config: &VlanConfig) -> Result<()> {
+        self.check_unique(config)?;
+        self.check_fields(config)
+    }
+
+    /// Record the VLAN ID and network, rejecting values seen before
+    fn check_unique(&mut self, config: &VlanConfig) -> Result<()> {
         // Check VLAN ID uniqueness
         if !self.unique_vlan_ids.insert(config.vlan_id) {
             return Err(ConfigError::validation(format!(
@@ -38,6 +44,11 @@ pub fn validate_config(&mut self, config: &VlanConfig) -> Result<()> {
             )));
         }
 
+        Ok(())
+    }
+
+    /// Checks that depend only on the configuration itself
+    fn check_fields(&self, config: &VlanConfig) -> Result<()> {
         // Validate VLAN ID range
         if !(10..=4094).contains(&config.vlan_id) {
             return Err(ConfigError::validation(format!(
@@ -68,6 +79,32 @@ pub fn validate_configs(&mut self, configs: &[VlanConfig]) -> Result<()> {
         Ok(())
     }
 
+    /// Validate multiple configurations, checking fields across threads
+    ///
+    /// Duplicate detection stays sequential, so the error returned is the same
+    /// one [`validate_configs`](Self::validate_configs) would report.
+    #[cfg(feature = "rayon")]
+    pub fn validate_configs_parallel(&mut self, configs: &[VlanConfig]) -> Result<()> {
+        use rayon::prelude::*;
+
+        let first_invalid = {
+            let engine = &*self;
+            configs
+                .par_iter()
+                .position_first(|config| engine.check_fields(config).is_err())
+        };
+
+        let checked = first_invalid.map_or(configs.len(), |index| index + 1);
+        for config in &configs[..checked] {
+            self.check_unique(config)?;
+        }
+
+        match first_invalid {
+            Some(index) => self.check_fields(&configs[index]),
+            None => Ok(()),
+        }
+    }
+
     /// Validate IP network format and RFC 1918 compliance
     fn validate_ip_network(&self, network: &str) -> Result<()> {
         // Check for expected format patterns
@@ -221,4 +258,29 @@ fn test_rfc1918_validation() {
         assert!(engine.validate_network_prefix("192.167.1").is_err());
         assert!(engine.validate_network_prefix("10.0.0").is_err()); // Reserved
     }
+
+    #[cfg(feature = "rayon")]
+    #[test]
+    fn test_parallel_validation_matches_sequential() {
+        let mut configs: Vec<VlanConfig> = (0..50)
+            .map(|i| {
+                VlanConfig::new(100 + i, format!("10.1.{i}.x"), format!("Test {i}"), 1).unwrap()
+            })
+            .collect();
+        configs[40].wan_assignment = 9;
+        configs[30].vlan_id = configs[10].vlan_id;
+
+        let sequential = ValidationEngine::new().validate_configs(&configs);
+        let parallel = ValidationEngine::new().validate_configs_parallel(&configs);
+        assert_eq!(
+            sequential.unwrap_err().to_string(),
+            parallel.unwrap_err().to_string()
+        );
+
+        configs[30].vlan_id = 130;
+        configs[40].wan_assignment = 1;
+        let mut engine = ValidationEngine::new();
+        assert!(engine.validate_configs_parallel(&configs).is_ok());
+        assert_eq!(engine.config_count(), 50);
+    }
 }
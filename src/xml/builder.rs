@@ -35,14 +35,19 @@ pub struct OutputConfig {
     pub streaming_threshold_mb: usize,
 }
 
+impl OutputConfig {
+    /// Default output settings, shared by every builder
+    pub const DEFAULT: Self = Self {
+        include_declaration: true,
+        pretty_print: true,
+        memory_limit_mb: 32,
+        streaming_threshold_mb: 10,
+    };
+}
+
 impl Default for OutputConfig {
     fn default() -> Self {
-        Self {
-            include_declaration: true,
-            pretty_print: true,
-            memory_limit_mb: 32,
-            streaming_threshold_mb: 10,
-        }
+        Self::DEFAULT
     }
 }
 
@@ -54,7 +59,7 @@ pub fn new() -> Self {
             template_content: None,
             components: Vec::new(),
             validation_rules: Vec::new(),
-            output_config: OutputConfig::default(),
+            output_config: OutputConfig::DEFAULT,
             xml_engine: XMLEngine::new(),
         }
     }
@@ -63,23 +68,15 @@ pub fn new() -> Self {
     pub fn with_template_file(template_path: PathBuf) -> Self {
         Self {
             template_path: Some(template_path),
-            template_content: None,
-            components: Vec::new(),
-            validation_rules: Vec::new(),
-            output_config: OutputConfig::default(),
-            xml_engine: XMLEngine::new(),
+            ..Self::new()
         }
     }
 
     /// Create a builder with template content
     pub fn with_template_content(content: String) -> Self {
         Self {
-            template_path: None,
             template_content: Some(content),
-            components: Vec::new(),
-            validation_rules: Vec::new(),
-            output_config: OutputConfig::default(),
-            xml_engine: XMLEngine::new(),
+            ..Self::new()
         }
     }
 
@@ -176,8 +173,9 @@ pub fn estimate_memory_usage(&self) -> usize {
     fn load_template(&mut self) -> XMLResult<XMLTemplate> {
         if let Some(ref path) = self.template_path {
             self.xml_engine.load_template(path)
-        } else if let Some(ref content) = self.template_content {
-            self.xml_engine.parse_template(content.clone())
+        } else if let Some(content) = self.template_content.take() {
+            // Builds consume the builder, so hand the content over instead of copying it
+            self.xml_engine.parse_template(content)
         } else {
             // Use a default OPNsense template
             let default_template = self.default_opnsense_template();
@@ -4,7 +4,7 @@
 use quick_xml::events::Event;
 use quick_xml::{Reader, Writer};
 use std::collections::HashMap;
-use std::io::{BufRead, Cursor, Write};
+use std::io::{BufRead, BufWriter, Write};
 use std::path::Path;
 
 /// Core XML processing engine using quick-xml events
@@ -49,17 +49,13 @@ pub fn load_template<P: AsRef<Path>>(&mut self, path: P) -> XMLResult<XMLTemplat
 
     /// Parse an XML template from string content
     pub fn parse_template(&mut self, content: String) -> XMLResult<XMLTemplate> {
-        let mut reader = Reader::from_str(&content);
-        reader.config_mut().trim_text(true);
-
         let events = Vec::new();
         let mut injection_points = HashMap::new();
         let mut depth = 0;
-        let _current_path: Vec<String> = Vec::new();
 
-        // Use a different approach to avoid lifetime issues
+        // Locate injection points in one pass over the raw content
         for (position, line) in content.lines().enumerate() {
-            if line.trim().contains("{{") && line.trim().contains("}}") {
+            if line.contains("{{") && line.contains("}}") {
                 let selector = format!("/line{position}");
                 injection_points.insert(selector, position);
             }
@@ -83,9 +79,13 @@ pub fn parse_template(&mut self, content: String) -> XMLResult<XMLTemplate> {
     }
 
     /// Process a series of XML events and generate output
+    ///
+    /// Output is written compactly in one pass into a buffer sized from the
+    /// events, with no indentation.
     pub fn process_events(&mut self, events: Vec<Event>) -> XMLResult<String> {
-        let mut output = Cursor::new(Vec::new());
-        let mut writer = Writer::new(&mut output);
+        // Event content plus room for the surrounding markup of each event
+        let capacity = events.iter().map(|event| event.len() + 3).sum();
+        let mut writer = Writer::new(Vec::with_capacity(capacity));
 
         for event in events {
             writer.write_event(event).map_err(|e| {
@@ -93,7 +93,7 @@ pub fn process_events(&mut self, events: Vec<Event>) -> XMLResult<String> {
             })?;
         }
 
-        let result = String::from_utf8(output.into_inner()).map_err(|e| {
+        let result = String::from_utf8(writer.into_inner()).map_err(|e| {
             XMLError::invalid_structure(format!("Invalid UTF-8 in XML output: {e}"))
         })?;
 
@@ -109,7 +109,11 @@ pub fn stream_process<R: BufRead, W: Write>(
     ) -> XMLResult<()> {
         let mut xml_reader = Reader::from_reader(reader);
         xml_reader.config_mut().trim_text(true);
-        let mut xml_writer = Writer::new(writer);
+        // Events are small, so batch them rather than hitting the sink per event
+        let mut xml_writer = Writer::new(BufWriter::with_capacity(
+            super::STREAM_BUFFER_CAPACITY,
+            writer,
+        ));
 
         let mut buf = Vec::new();
 
@@ -132,6 +136,11 @@ pub fn stream_process<R: BufRead, W: Write>(
             buf.clear();
         }
 
+        xml_writer
+            .into_inner()
+            .flush()
+            .map_err(|e| XMLError::generation("StreamProcessor", format!("Flush failed: {e}")))?;
+
         Ok(())
     }
 
@@ -402,4 +411,32 @@ fn test_process_events() {
         assert!(result.contains("<root>"));
         assert!(result.contains("</root>"));
     }
+
+    #[test]
+    fn test_process_events_is_compact() {
+        let mut engine = XMLEngine::new();
+        let events = vec![
+            Event::Start(BytesStart::new("root")),
+            Event::Start(BytesStart::new("item")),
+            Event::Text(BytesText::new("value")),
+            Event::End(BytesEnd::new("item")),
+            Event::End(BytesEnd::new("root")),
+        ];
+
+        let result = engine.process_events(events).unwrap();
+        assert_eq!(result, "<root><item>value</item></root>");
+    }
+
+    #[test]
+    fn test_stream_process_flushes_output() {
+        let mut engine = XMLEngine::new();
+        let input = "<root><item>value</item></root>";
+
+        let mut output = Vec::new();
+        engine
+            .stream_process(input.as_bytes(), &mut output, |_| Ok(None))
+            .unwrap();
+
+        assert_eq!(String::from_utf8(output).unwrap(), input);
+    }
 }
@@ -1,6 +1,8 @@
 //! XML component generators for structured XML generation
 
 use crate::generator::VlanConfig;
+use crate::generator::vlan::HostAddresses;
+use crate::utils::ids::random_uuid;
 use crate::xml::error::XMLResult;
 use crate::xml::template::escape_xml_string;
 use quick_xml::events::{BytesEnd, BytesStart, BytesText, Event};
@@ -59,7 +61,7 @@ pub trait XMLGenerator: Send + Sync {
 
     /// Get component identifier for debugging
     fn component_id(&self) -> String {
-        format!("{}_{}", self.component_type(), uuid::Uuid::new_v4())
+        format!("{}_{}", self.component_type(), random_uuid())
     }
 
     /// Check if this generator supports streaming output
@@ -126,6 +128,30 @@ pub fn has_warnings(&self) -> bool {
     }
 }
 
+/// Callback receiving XML events one at a time
+type EventSink<'a> = dyn FnMut(Event<'static>) -> XMLResult<()> + 'a;
+
+/// Emit a `<tag>text</tag>` leaf element
+fn emit_leaf(emit: &mut EventSink<'_>, tag: &'static str, text: &str) -> XMLResult<()> {
+    emit(Event::Start(BytesStart::new(tag)))?;
+    emit(Event::Text(BytesText::new(text).into_owned()))?;
+    emit(Event::End(BytesEnd::new(tag)))
+}
+
+/// Emit a `<tag>value</tag>` leaf for a number
+///
+/// Digits never need escaping, so the formatted text is handed over as-is
+/// instead of being escaped and copied again by `BytesText::new`.
+fn emit_number_leaf(
+    emit: &mut EventSink<'_>,
+    tag: &'static str,
+    value: impl fmt::Display,
+) -> XMLResult<()> {
+    emit(Event::Start(BytesStart::new(tag)))?;
+    emit(Event::Text(BytesText::from_escaped(value.to_string())))?;
+    emit(Event::End(BytesEnd::new(tag)))
+}
+
 /// VLAN XML generator implementation
 pub struct VlanGenerator {
     config: VlanConfig,
@@ -148,15 +174,20 @@ pub struct VlanGeneratorOptions {
     pub opt_counter: u16,
 }
 
+impl VlanGeneratorOptions {
+    /// Default generator options, shared by every VLAN generator
+    pub const DEFAULT: Self = Self {
+        include_dhcp: true,
+        include_firewall_rules: false,
+        include_nat_rules: false,
+        firewall_number: 1,
+        opt_counter: 1,
+    };
+}
+
 impl Default for VlanGeneratorOptions {
     fn default() -> Self {
-        Self {
-            include_dhcp: true,
-            include_firewall_rules: false,
-            include_nat_rules: false,
-            firewall_number: 1,
-            opt_counter: 1,
-        }
+        Self::DEFAULT
     }
 }
 
@@ -166,7 +197,7 @@ pub fn new(config: VlanConfig) -> Self {
         Self {
             config,
             template_fragment: None,
-            options: VlanGeneratorOptions::default(),
+            options: VlanGeneratorOptions::DEFAULT,
         }
     }
 
@@ -188,197 +219,141 @@ pub fn with_template_fragment(mut self, fragment: String) -> Self {
     /// Generate VLAN XML section events
     fn generate_vlan_events(&self) -> XMLResult<Vec<Event<'static>>> {
         let mut events = Vec::new();
+        self.emit_vlan_events(&mut |event| {
+            events.push(event);
+            Ok(())
+        })?;
+        Ok(events)
+    }
 
+    /// Emit VLAN XML section events without buffering them
+    fn emit_vlan_events(&self, emit: &mut EventSink<'_>) -> XMLResult<()> {
         // Start VLAN element
-        let vlan_start = BytesStart::new("vlan");
-        events.push(Event::Start(vlan_start));
+        emit(Event::Start(BytesStart::new("vlan")))?;
 
         // VLAN ID
-        events.push(Event::Start(BytesStart::new("vlanid")));
-        let vlan_id_text = self.config.vlan_id.to_string();
-        events.push(Event::Text(BytesText::new(&vlan_id_text).into_owned()));
-        events.push(Event::End(BytesEnd::new("vlanid")));
+        emit_number_leaf(emit, "vlanid", self.config.vlan_id)?;
 
-        // Description
-        events.push(Event::Start(BytesStart::new("descr")));
+        // Description, escaped once here and handed to the writer as-is
         let description_text = escape_xml_string(&self.config.description);
-        events.push(Event::Text(BytesText::new(&description_text).into_owned()));
-        events.push(Event::End(BytesEnd::new("descr")));
+        emit(Event::Start(BytesStart::new("descr")))?;
+        emit(Event::Text(BytesText::from_escaped(description_text)))?;
+        emit(Event::End(BytesEnd::new("descr")))?;
 
         // Network configuration
-        events.push(Event::Start(BytesStart::new("subnet")));
-        events.push(Event::Text(
-            BytesText::new(&self.config.ip_network).into_owned(),
-        ));
-        events.push(Event::End(BytesEnd::new("subnet")));
+        emit_leaf(emit, "subnet", &self.config.ip_network)?;
+
+        // Gateway and DHCP range addresses, derived once for this VLAN
+        let hosts = self.config.host_addresses().ok();
 
         // Gateway IP if available
-        if let Ok(gateway) = self.config.gateway_ip() {
-            events.push(Event::Start(BytesStart::new("gateway")));
-            events.push(Event::Text(BytesText::new(&gateway).into_owned()));
-            events.push(Event::End(BytesEnd::new("gateway")));
+        if let Some(hosts) = &hosts {
+            emit_leaf(emit, "gateway", &hosts.gateway)?;
         }
 
         // DHCP configuration if enabled
         if self.options.include_dhcp {
-            events.extend(self.generate_dhcp_events()?);
+            self.emit_dhcp_events(emit, hosts.as_ref())?;
         }
 
         // End VLAN element
-        events.push(Event::End(BytesEnd::new("vlan")));
-
-        Ok(events)
+        emit(Event::End(BytesEnd::new("vlan")))
     }
 
-    /// Generate DHCP server configuration events
-    fn generate_dhcp_events(&self) -> XMLResult<Vec<Event<'static>>> {
+    /// Emit DHCP server configuration events
+    fn emit_dhcp_events(
+        &self,
+        emit: &mut EventSink<'_>,
+        hosts: Option<&HostAddresses>,
+    ) -> XMLResult<()> {
         // Get enhanced DHCP configuration
         let dhcp_config = match self.config.dhcp_server_config() {
             Ok(config) => config,
             Err(_) => {
                 // Fallback to basic configuration if enhanced config fails
-                return self.generate_basic_dhcp_events();
+                return self.emit_basic_dhcp_events(emit, hosts);
             }
         };
 
-        let mut events = vec![
-            // Start DHCP element
-            Event::Start(BytesStart::new("dhcp")),
-            // Enable DHCP
-            Event::Start(BytesStart::new("enable")),
-            Event::Text(BytesText::new(if dhcp_config.enabled { "1" } else { "0" }).into_owned()),
-            Event::End(BytesEnd::new("enable")),
-        ];
+        // Start DHCP element
+        emit(Event::Start(BytesStart::new("dhcp")))?;
+
+        // Enable DHCP
+        emit_leaf(emit, "enable", if dhcp_config.enabled { "1" } else { "0" })?;
 
         // DHCP range
-        events.push(Event::Start(BytesStart::new("range")));
-        events.push(Event::Start(BytesStart::new("from")));
-        events.push(Event::Text(
-            BytesText::new(&dhcp_config.range_start).into_owned(),
-        ));
-        events.push(Event::End(BytesEnd::new("from")));
-
-        events.push(Event::Start(BytesStart::new("to")));
-        events.push(Event::Text(
-            BytesText::new(&dhcp_config.range_end).into_owned(),
-        ));
-        events.push(Event::End(BytesEnd::new("to")));
-        events.push(Event::End(BytesEnd::new("range")));
+        emit(Event::Start(BytesStart::new("range")))?;
+        emit_leaf(emit, "from", &dhcp_config.range_start)?;
+        emit_leaf(emit, "to", &dhcp_config.range_end)?;
+        emit(Event::End(BytesEnd::new("range")))?;
 
         // Default lease time
-        events.push(Event::Start(BytesStart::new("defaultleasetime")));
-        events.push(Event::Text(
-            BytesText::new(&dhcp_config.lease_time.to_string()).into_owned(),
-        ));
-        events.push(Event::End(BytesEnd::new("defaultleasetime")));
+        emit_number_leaf(emit, "defaultleasetime", dhcp_config.lease_time)?;
 
         // Maximum lease time
-        events.push(Event::Start(BytesStart::new("maxleasetime")));
-        events.push(Event::Text(
-            BytesText::new(&dhcp_config.max_lease_time.to_string()).into_owned(),
-        ));
-        events.push(Event::End(BytesEnd::new("maxleasetime")));
+        emit_number_leaf(emit, "maxleasetime", dhcp_config.max_lease_time)?;
 
         // Gateway
-        events.push(Event::Start(BytesStart::new("gateway")));
-        events.push(Event::Text(
-            BytesText::new(&dhcp_config.gateway).into_owned(),
-        ));
-        events.push(Event::End(BytesEnd::new("gateway")));
+        emit_leaf(emit, "gateway", &dhcp_config.gateway)?;
 
         // Domain name
-        events.push(Event::Start(BytesStart::new("domain")));
-        events.push(Event::Text(
-            BytesText::new(&dhcp_config.domain_name).into_owned(),
-        ));
-        events.push(Event::End(BytesEnd::new("domain")));
+        emit_leaf(emit, "domain", &dhcp_config.domain_name)?;
 
         // DNS servers (multiple entries)
         for dns_server in &dhcp_config.dns_servers {
-            events.push(Event::Start(BytesStart::new("dnsserver")));
-            events.push(Event::Text(BytesText::new(dns_server).into_owned()));
-            events.push(Event::End(BytesEnd::new("dnsserver")));
+            emit_leaf(emit, "dnsserver", dns_server)?;
         }
 
         // NTP servers
         for ntp_server in &dhcp_config.ntp_servers {
-            events.push(Event::Start(BytesStart::new("ntpserver")));
-            events.push(Event::Text(BytesText::new(ntp_server).into_owned()));
-            events.push(Event::End(BytesEnd::new("ntpserver")));
+            emit_leaf(emit, "ntpserver", ntp_server)?;
         }
 
         // Static reservations
         for reservation in &dhcp_config.static_reservations {
-            events.push(Event::Start(BytesStart::new("staticmap")));
-
-            events.push(Event::Start(BytesStart::new("mac")));
-            events.push(Event::Text(BytesText::new(&reservation.mac).into_owned()));
-            events.push(Event::End(BytesEnd::new("mac")));
-
-            events.push(Event::Start(BytesStart::new("ipaddr")));
-            events.push(Event::Text(
-                BytesText::new(&reservation.ip_addr).into_owned(),
-            ));
-            events.push(Event::End(BytesEnd::new("ipaddr")));
-
-            events.push(Event::Start(BytesStart::new("hostname")));
-            events.push(Event::Text(
-                BytesText::new(&reservation.hostname).into_owned(),
-            ));
-            events.push(Event::End(BytesEnd::new("hostname")));
-
-            events.push(Event::End(BytesEnd::new("staticmap")));
+            emit(Event::Start(BytesStart::new("staticmap")))?;
+            emit_leaf(emit, "mac", &reservation.mac)?;
+            emit_leaf(emit, "ipaddr", &reservation.ip_addr)?;
+            emit_leaf(emit, "hostname", &reservation.hostname)?;
+            emit(Event::End(BytesEnd::new("staticmap")))?;
         }
 
         // End DHCP element
-        events.push(Event::End(BytesEnd::new("dhcp")));
-
-        Ok(events)
+        emit(Event::End(BytesEnd::new("dhcp")))
     }
 
-    /// Generate basic DHCP configuration events (fallback)
-    fn generate_basic_dhcp_events(&self) -> XMLResult<Vec<Event<'static>>> {
-        let mut events = vec![
-            // Start DHCP element
-            Event::Start(BytesStart::new("dhcp")),
-            // Enable DHCP
-            Event::Start(BytesStart::new("enable")),
-            Event::Text(BytesText::new("1").into_owned()),
-            Event::End(BytesEnd::new("enable")),
-        ];
-
-        // DHCP range
-        if let (Ok(start), Ok(end)) = (self.config.dhcp_range_start(), self.config.dhcp_range_end())
-        {
-            events.push(Event::Start(BytesStart::new("range")));
-
-            events.push(Event::Start(BytesStart::new("from")));
-            events.push(Event::Text(BytesText::new(&start).into_owned()));
-            events.push(Event::End(BytesEnd::new("from")));
+    /// Emit basic DHCP configuration events (fallback)
+    fn emit_basic_dhcp_events(
+        &self,
+        emit: &mut EventSink<'_>,
+        hosts: Option<&HostAddresses>,
+    ) -> XMLResult<()> {
+        // Start DHCP element
+        emit(Event::Start(BytesStart::new("dhcp")))?;
 
-            events.push(Event::Start(BytesStart::new("to")));
-            events.push(Event::Text(BytesText::new(&end).into_owned()));
-            events.push(Event::End(BytesEnd::new("to")));
+        // Enable DHCP
+        emit_leaf(emit, "enable", "1")?;
 
-            events.push(Event::End(BytesEnd::new("range")));
+        // DHCP range
+        if let Some(hosts) = hosts {
+            emit(Event::Start(BytesStart::new("range")))?;
+            emit_leaf(emit, "from", &hosts.dhcp_start)?;
+            emit_leaf(emit, "to", &hosts.dhcp_end)?;
+            emit(Event::End(BytesEnd::new("range")))?;
         }
 
         // Domain name
-        events.push(Event::Start(BytesStart::new("domain")));
-        events.push(Event::Text(BytesText::new("local").into_owned()));
-        events.push(Event::End(BytesEnd::new("domain")));
+        emit_leaf(emit, "domain", "local")?;
 
         // DNS servers
-        events.push(Event::Start(BytesStart::new("dnsserver")));
-        if let Ok(gateway) = self.config.gateway_ip() {
-            events.push(Event::Text(BytesText::new(&gateway).into_owned()));
+        emit(Event::Start(BytesStart::new("dnsserver")))?;
+        if let Some(hosts) = hosts {
+            emit(Event::Text(BytesText::new(&hosts.gateway).into_owned()))?;
         }
-        events.push(Event::End(BytesEnd::new("dnsserver")));
+        emit(Event::End(BytesEnd::new("dnsserver")))?;
 
         // End DHCP element
-        events.push(Event::End(BytesEnd::new("dhcp")));
-
-        Ok(events)
+        emit(Event::End(BytesEnd::new("dhcp")))
     }
 }
 
@@ -422,16 +397,13 @@ fn validate_requirements(&self) -> ValidationResult {
             errors.push("IP network format is invalid".to_string());
         }
 
-        // Check gateway IP generation
-        if self.config.gateway_ip().is_err() {
+        // Gateway and DHCP range are both derived from the network prefix, so a
+        // single presence check covers them without formatting any addresses
+        if self.config.network_prefix().is_none() {
             warnings.push("Cannot generate gateway IP from network format".to_string());
-        }
-
-        // Check DHCP range generation
-        if self.options.include_dhcp
-            && (self.config.dhcp_range_start().is_err() || self.config.dhcp_range_end().is_err())
-        {
-            warnings.push("Cannot generate DHCP range from network format".to_string());
+            if self.options.include_dhcp {
+                warnings.push("Cannot generate DHCP range from network format".to_string());
+            }
         }
 
         if errors.is_empty() {
@@ -473,11 +445,15 @@ fn generate_streaming_events(
         &self,
         callback: &mut dyn FnMut(Event<'static>) -> XMLResult<()>,
     ) -> XMLResult<()> {
-        let events = self.generate_events()?;
-        for event in events {
-            callback(event)?;
+        if self.template_fragment.is_some() {
+            for event in self.generate_events()? {
+                callback(event)?;
+            }
+            return Ok(());
         }
-        Ok(())
+
+        // Hand each event to the caller as soon as it is built
+        self.emit_vlan_events(callback)
     }
 }
 
@@ -574,6 +550,51 @@ fn test_vlan_generator_events_generation() {
         assert!(has_end);
     }
 
+    #[test]
+    fn test_emit_leaf_emits_start_text_end() {
+        let mut events = Vec::new();
+        emit_leaf(
+            &mut |event| {
+                events.push(event);
+                Ok(())
+            },
+            "vlanid",
+            "100",
+        )
+        .unwrap();
+
+        assert_eq!(events.len(), 3);
+        assert!(matches!(&events[0], Event::Start(start) if start.name().as_ref() == b"vlanid"));
+        assert!(matches!(&events[1], Event::Text(text) if &**text == b"100"));
+        assert!(matches!(&events[2], Event::End(end) if end.name().as_ref() == b"vlanid"));
+    }
+
+    #[test]
+    fn test_emit_number_leaf_matches_emit_leaf() {
+        let mut numbered = Vec::new();
+        emit_number_leaf(
+            &mut |event| {
+                numbered.push(event);
+                Ok(())
+            },
+            "maxleasetime",
+            86400u32,
+        )
+        .unwrap();
+        let mut plain = Vec::new();
+        emit_leaf(
+            &mut |event| {
+                plain.push(event);
+                Ok(())
+            },
+            "maxleasetime",
+            "86400",
+        )
+        .unwrap();
+
+        assert_eq!(numbered, plain);
+    }
+
     #[test]
     fn test_escape_xml_text() {
         assert_eq!(escape_xml_string("Hello & World"), "Hello &amp; World");
@@ -600,6 +621,39 @@ fn test_vlan_generator_with_options() {
         assert!(memory_estimate > 512); // Should be larger with DHCP and firewall
     }
 
+    #[test]
+    fn test_streaming_events_match_batch_events() {
+        let config =
+            VlanConfig::new(100, "10.1.2.x".to_string(), "IT VLAN 100".to_string(), 1).unwrap();
+        let generator = VlanGenerator::new(config);
+        let batch = generator.generate_events().unwrap();
+
+        let mut streamed = Vec::new();
+        generator
+            .generate_streaming_events(&mut |event| {
+                streamed.push(event);
+                Ok(())
+            })
+            .unwrap();
+
+        assert_eq!(streamed, batch);
+    }
+
+    #[test]
+    fn test_description_is_escaped_once() {
+        let config = VlanConfig::new(100, "10.1.2.x".to_string(), "R&D".to_string(), 1).unwrap();
+        let events = VlanGenerator::new(config).generate_events().unwrap();
+
+        let texts: Vec<&[u8]> = events
+            .iter()
+            .filter_map(|event| match event {
+                Event::Text(text) => Some(text.as_ref()),
+                _ => None,
+            })
+            .collect();
+        assert!(texts.contains(&b"R&amp;D".as_slice()));
+    }
+
     #[test]
     fn test_vlan_generator_supports_streaming() {
         let config =
@@ -1,10 +1,12 @@
 //! XML injection mechanisms for structured event injection
 
 use crate::xml::engine::XMLTemplate;
-use crate::xml::error::XMLResult;
+use crate::xml::error::{XMLError, XMLResult};
 use crate::xml::generator::XMLGenerator;
+use quick_xml::Writer;
 use quick_xml::events::Event;
 use std::collections::HashMap;
+use std::io::{BufWriter, Write};
 
 /// XML injector for combining templates with generated components
 pub struct XMLInjector {
@@ -39,18 +41,41 @@ pub fn add_mapping<K: Into<String>, V: Into<String>>(&mut self, selector: K, tar
     pub fn inject_components(&mut self) -> XMLResult<Vec<Event<'static>>> {
         let mut result_events = Vec::new();
 
-        // For now, just combine events from all generators
+        // Generators append straight into the combined list rather than each
+        // building its own fragment to be merged afterwards
         for generator in &self.generators {
-            let events = generator.generate_events()?;
-            result_events.extend(events);
+            generator.generate_streaming_events(&mut |event| {
+                result_events.push(event);
+                Ok(())
+            })?;
         }
 
         Ok(result_events)
     }
 
     /// Stream injection for large configurations
-    pub fn stream_inject<W: std::io::Write>(&mut self, _writer: W) -> XMLResult<()> {
-        // Placeholder implementation
+    ///
+    /// Each event is written as soon as its generator emits it, so the
+    /// combined document is never held in memory.
+    pub fn stream_inject<W: Write>(&mut self, writer: W) -> XMLResult<()> {
+        let mut xml_writer = Writer::new(BufWriter::with_capacity(
+            super::STREAM_BUFFER_CAPACITY,
+            writer,
+        ));
+
+        for generator in &self.generators {
+            generator.generate_streaming_events(&mut |event| {
+                xml_writer.write_event(event).map_err(|e| {
+                    XMLError::generation("StreamInjector", format!("Write failed: {e}"))
+                })
+            })?;
+        }
+
+        xml_writer
+            .into_inner()
+            .flush()
+            .map_err(|e| XMLError::generation("StreamInjector", format!("Flush failed: {e}")))?;
+
         Ok(())
     }
 
@@ -172,4 +197,39 @@ fn test_validate_injections() {
         let validation = injector.validate_injections();
         assert!(validation.is_valid);
     }
+
+    #[test]
+    fn test_stream_inject_matches_buffered_output() {
+        let new_injector = || {
+            let template = XMLTemplate::new(
+                Vec::new(),
+                HashMap::new(),
+                TemplateMetadata {
+                    original_content: String::new(),
+                    memory_usage: 0,
+                    depth: 0,
+                    namespaces: HashMap::new(),
+                },
+            );
+            let mut injector = XMLInjector::new(template);
+            let config =
+                VlanConfig::new(100, "10.1.2.x".to_string(), "Test".to_string(), 1).unwrap();
+            injector.add_generator(Box::new(VlanGenerator::new(config)));
+            injector
+        };
+
+        let events = new_injector().inject_components().unwrap();
+        let mut buffered = Writer::new(Vec::new());
+        for event in events {
+            buffered.write_event(event).unwrap();
+        }
+        let buffered = String::from_utf8(buffered.into_inner()).unwrap();
+
+        let mut streamed = Vec::new();
+        new_injector().stream_inject(&mut streamed).unwrap();
+        let streamed = String::from_utf8(streamed).unwrap();
+
+        assert!(streamed.contains("<vlan"));
+        assert_eq!(streamed, buffered);
+    }
 }
@@ -8,6 +8,12 @@
 pub mod streaming;
 pub mod template;
 
+/// Buffer size for the streaming XML writers
+///
+/// Events are only a few bytes each, so a buffer well above the 8 KiB
+/// `BufWriter` default keeps large documents to a handful of writes.
+pub(crate) const STREAM_BUFFER_CAPACITY: usize = 256 * 1024;
+
 // Re-export key types for convenient usage
 pub use builder::OPNsenseConfigBuilder;
 pub use engine::XMLEngine;
@@ -7,55 +7,36 @@
 use crate::generator::VlanConfig;
 use crate::model::ConfigError;
 
-use bumpalo::Bump;
-use lru::LruCache;
-use rustc_hash::FxHashMap;
 use std::io::Write;
-use std::num::NonZeroUsize;
 
 /// Average size of a VLAN XML block in bytes
 const VLAN_AVG_SIZE: usize = 256;
 
-/// Template cache entry for compiled XML templates
-#[derive(Debug, Clone)]
-struct CompiledTemplate {
-    header: String,
-    #[allow(dead_code)]
-    vlan_template: String,
-    #[allow(dead_code)]
-    footer: String,
-}
+/// XML declaration, root element and static system section
+const XML_HEADER: &str = r#"<?xml version="1.0"?>
+<opnsense>
+  <version>24.7</version>
+  <system>
+    <hostname>opnsense</hostname>
+    <domain>local</domain>
+  </system>
+  <interfaces>
+"#;
+
+/// Closing tags for the interfaces section and root element
+const XML_FOOTER: &str = "</interfaces>\n</opnsense>\n";
 
 /// High-performance streaming XML generator
 pub struct StreamingXmlGenerator {
-    /// Arena allocator for temporary strings
-    arena: Bump,
-
-    /// LRU cache for compiled templates
-    template_cache: LruCache<String, CompiledTemplate>,
-
     /// Pre-allocated string buffer for XML generation
     xml_buffer: String,
-
-    /// Fast lookup for XML escaping
-    escape_map: FxHashMap<char, &'static str>,
 }
 
 impl StreamingXmlGenerator {
     /// Create a new streaming XML generator
     pub fn new() -> Self {
-        let mut escape_map = FxHashMap::default();
-        escape_map.insert('<', "&lt;");
-        escape_map.insert('>', "&gt;");
-        escape_map.insert('&', "&amp;");
-        escape_map.insert('"', "&quot;");
-        escape_map.insert('\'', "&apos;");
-
         Self {
-            arena: Bump::new(),
-            template_cache: LruCache::new(NonZeroUsize::new(8).unwrap()),
             xml_buffer: String::with_capacity(8192), // 8KB initial capacity
-            escape_map,
         }
     }
 
@@ -69,31 +50,30 @@ pub fn generate_config_streaming<W: Write>(
         let mut bytes_written = 0;
 
         // Write XML declaration and root element
-        let header = self.get_xml_header();
-        writer.write_all(header.as_bytes()).map_err(|source| {
+        writer.write_all(XML_HEADER.as_bytes()).map_err(|source| {
             ConfigError::xml_template(format!("Failed to write header: {}", source))
         })?;
-        bytes_written += header.len();
+        bytes_written += XML_HEADER.len();
 
-        // Write VLAN configurations in chunks to manage memory
+        // Write VLAN configurations in chunks to manage memory, reusing one buffer
         const CHUNK_SIZE: usize = 100;
+        let mut chunk_xml = String::with_capacity(CHUNK_SIZE * VLAN_AVG_SIZE);
         for chunk in configs.chunks(CHUNK_SIZE) {
-            let chunk_xml = self.generate_vlan_chunk_xml(chunk)?;
+            chunk_xml.clear();
+            for config in chunk {
+                Self::write_vlan_xml(&mut chunk_xml, config);
+            }
             writer.write_all(chunk_xml.as_bytes()).map_err(|source| {
                 ConfigError::xml_template(format!("Failed to write VLAN chunk: {}", source))
             })?;
             bytes_written += chunk_xml.len();
-
-            // Reset arena for next chunk
-            self.arena.reset();
         }
 
         // Write footer with proper closing tags
-        let footer = "</interfaces>\n</opnsense>\n";
-        writer.write_all(footer.as_bytes()).map_err(|source| {
+        writer.write_all(XML_FOOTER.as_bytes()).map_err(|source| {
             ConfigError::xml_template(format!("Failed to write footer: {}", source))
         })?;
-        bytes_written += footer.len();
+        bytes_written += XML_FOOTER.len();
 
         Ok(bytes_written)
     }
@@ -110,95 +90,33 @@ pub fn generate_config_optimized(
         self.xml_buffer.reserve(estimated_size);
 
         // Generate XML sections
-        let header = self.get_xml_header();
-        self.xml_buffer.push_str(&header);
+        self.xml_buffer.push_str(XML_HEADER);
 
-        // Generate all VLANs
+        // Generate all VLANs straight into the buffer
         for config in configs {
-            let vlan_xml = self.generate_vlan_xml_optimized(config)?;
-            self.xml_buffer.push_str(&vlan_xml);
+            Self::write_vlan_xml(&mut self.xml_buffer, config);
         }
 
         // Add proper closing tags
-        self.xml_buffer.push_str("</interfaces>\n</opnsense>\n");
+        self.xml_buffer.push_str(XML_FOOTER);
 
         Ok(self.xml_buffer.clone())
     }
 
-    /// Get XML header with caching
-    fn get_xml_header(&mut self) -> String {
-        let cache_key = "header".to_string();
-
-        if let Some(cached) = self.template_cache.get(&cache_key) {
-            cached.header.clone()
-        } else {
-            let header = self.generate_xml_header();
-            let template = CompiledTemplate {
-                header: header.clone(),
-                vlan_template: String::new(),
-                footer: String::new(),
-            };
-            self.template_cache.put(cache_key, template);
-            header
-        }
-    }
-
-    /// Generate VLAN chunk XML
-    fn generate_vlan_chunk_xml(&mut self, chunk: &[VlanConfig]) -> Result<String> {
-        // Preallocate buffer with estimated capacity to minimize reallocations
-        let estimated_capacity = chunk.len().saturating_mul(VLAN_AVG_SIZE);
-        let mut chunk_xml = String::with_capacity(estimated_capacity);
-
-        for config in chunk {
-            let vlan_xml = self.generate_vlan_xml_optimized(config)?;
-            chunk_xml.push_str(&vlan_xml);
-        }
-
-        Ok(chunk_xml)
-    }
-
-    /// Generate XML header template
-    fn generate_xml_header(&self) -> String {
-        r#"<?xml version="1.0"?>
-<opnsense>
-  <version>24.7</version>
-  <system>
-    <hostname>opnsense</hostname>
-    <domain>local</domain>
-  </system>
-  <interfaces>
-"#
-        .to_string()
-    }
-
-    /// Generate optimized VLAN XML
-    fn generate_vlan_xml_optimized(&mut self, config: &VlanConfig) -> Result<String> {
-        // Use arena allocation for temporary strings
-        let vlan_xml = self.arena.alloc_str(&format!(
-            r#"    <vlan id="{}" wan="{}" description="{}">
-      <network>{}</network>
-    </vlan>
-"#,
-            config.vlan_id,
-            config.wan_assignment,
-            self.escape_xml_fast(&config.description),
-            config.ip_network
-        ));
-
-        Ok(vlan_xml.to_string())
-    }
+    /// Append one VLAN block to `out`, escaping the description in place
+    fn write_vlan_xml(out: &mut String, config: &VlanConfig) {
+        use std::fmt::Write as _;
 
-    /// Fast XML escaping using pre-built map
-    fn escape_xml_fast(&self, text: &str) -> String {
-        let mut result = String::with_capacity(text.len());
-        for ch in text.chars() {
-            if let Some(&escaped) = self.escape_map.get(&ch) {
-                result.push_str(escaped);
-            } else {
-                result.push(ch);
-            }
-        }
-        result
+        // Writing into a String cannot fail
+        let _ = write!(
+            out,
+            r#"    <vlan id="{}" wan="{}" description=""#,
+            config.vlan_id, config.wan_assignment
+        );
+        escape_into(out, &config.description);
+        out.push_str("\">\n      <network>");
+        out.push_str(&config.ip_network);
+        out.push_str("</network>\n    </vlan>\n");
     }
 
     /// Estimate XML size for pre-allocation
@@ -212,9 +130,7 @@ fn estimate_xml_size(&self, vlan_count: usize) -> usize {
 
     /// Reset generator state
     pub fn reset(&mut self) {
-        self.arena.reset();
         self.xml_buffer.clear();
-        self.template_cache.clear();
     }
 
     /// Generate XML with parallel processing
@@ -230,20 +146,18 @@ pub fn generate_parallel(&mut self, configs: &[VlanConfig]) -> Result<String> {
             .par_chunks(chunk_size)
             .enumerate()
             .map(|(chunk_idx, chunk)| {
-                let mut local_generator = StreamingXmlGenerator::new();
-
                 if chunk_idx == 0 {
                     // First chunk includes header
-                    let mut result = local_generator.get_xml_header();
+                    let mut result = String::from(XML_HEADER);
                     for config in chunk {
-                        result.push_str(&local_generator.generate_vlan_xml_optimized(config)?);
+                        Self::write_vlan_xml(&mut result, config);
                     }
                     Ok(result)
                 } else {
                     // Other chunks only contain VLAN data
                     let mut result = String::new();
                     for config in chunk {
-                        result.push_str(&local_generator.generate_vlan_xml_optimized(config)?);
+                        Self::write_vlan_xml(&mut result, config);
                     }
                     Ok(result)
                 }
@@ -255,12 +169,38 @@ pub fn generate_parallel(&mut self, configs: &[VlanConfig]) -> Result<String> {
             final_xml.push_str(&part);
         }
         // Add proper closing tags
-        final_xml.push_str("</interfaces>\n</opnsense>\n");
+        final_xml.push_str(XML_FOOTER);
 
         Ok(final_xml)
     }
 }
 
+/// XML entity for a character that must be escaped
+///
+/// A compile-time table shared by every generator, rather than a hash map
+/// rebuilt for each instance.
+fn xml_entity(ch: char) -> Option<&'static str> {
+    match ch {
+        '<' => Some("&lt;"),
+        '>' => Some("&gt;"),
+        '&' => Some("&amp;"),
+        '"' => Some("&quot;"),
+        '\'' => Some("&apos;"),
+        _ => None,
+    }
+}
+
+/// Append `text` to `out`, escaping XML special characters
+fn escape_into(out: &mut String, text: &str) {
+    for ch in text.chars() {
+        if let Some(escaped) = xml_entity(ch) {
+            out.push_str(escaped);
+        } else {
+            out.push(ch);
+        }
+    }
+}
+
 impl Default for StreamingXmlGenerator {
     fn default() -> Self {
         Self::new()
@@ -276,7 +216,8 @@ mod tests {
     fn test_streaming_xml_generator_creation() {
         let generator = StreamingXmlGenerator::new();
         assert!(generator.xml_buffer.capacity() >= 8192);
-        assert_eq!(generator.escape_map.len(), 5);
+        let entities = ['<', '>', '&', '"', '\''].map(xml_entity);
+        assert!(entities.iter().all(Option::is_some));
     }
 
     #[test]
@@ -319,9 +260,9 @@ fn test_xml_streaming_generation() {
 
     #[test]
     fn test_xml_escaping() {
-        let generator = StreamingXmlGenerator::new();
         let text = "Test & <data> with \"quotes\"";
-        let escaped = generator.escape_xml_fast(text);
+        let mut escaped = String::new();
+        escape_into(&mut escaped, text);
 
         assert!(escaped.contains("&amp;"));
         assert!(escaped.contains("&lt;"));
@@ -329,6 +270,20 @@ fn test_xml_escaping() {
         assert!(escaped.contains("&quot;"));
     }
 
+    #[test]
+    fn test_write_vlan_xml_escapes_description() {
+        let config =
+            VlanConfig::new(100, "10.1.2.x".to_string(), "R&D <lab>".to_string(), 1).unwrap();
+
+        let mut out = String::new();
+        StreamingXmlGenerator::write_vlan_xml(&mut out, &config);
+
+        assert_eq!(
+            out,
+            "    <vlan id=\"100\" wan=\"1\" description=\"R&amp;D &lt;lab&gt;\">\n      <network>10.1.2.x</network>\n    </vlan>\n"
+        );
+    }
+
     #[test]
     fn test_memory_efficiency() {
         let mut generator = StreamingXmlGenerator::new();
@@ -3,10 +3,45 @@
 use crate::Result;
 use crate::generator::VlanConfig;
 use crate::model::ConfigError;
+use std::borrow::Cow;
+
+/// Placeholder for the VLAN ID
+const VLAN_ID: &str = "{{VLAN_ID}}";
+/// Placeholder for the IP network
+const IP_NETWORK: &str = "{{IP_NETWORK}}";
+/// Placeholder for the VLAN description
+const DESCRIPTION: &str = "{{DESCRIPTION}}";
+/// Placeholder for the WAN assignment
+const WAN_ASSIGNMENT: &str = "{{WAN_ASSIGNMENT}}";
+/// Placeholder for the firewall number
+const FIREWALL_NR: &str = "{{FIREWALL_NR}}";
+/// Placeholder for the OPT interface counter
+const OPT_COUNTER: &str = "{{OPT_COUNTER}}";
+/// Placeholder for the gateway IP
+const GATEWAY_IP: &str = "{{GATEWAY_IP}}";
+/// Placeholder for the DHCP range start
+const DHCP_START: &str = "{{DHCP_START}}";
+/// Placeholder for the DHCP range end
+const DHCP_END: &str = "{{DHCP_END}}";
+
+/// All placeholders understood by [`XmlTemplate::apply_configuration`]
+const PLACEHOLDERS: &[&str] = &[
+    VLAN_ID,
+    IP_NETWORK,
+    DESCRIPTION,
+    WAN_ASSIGNMENT,
+    FIREWALL_NR,
+    OPT_COUNTER,
+    GATEWAY_IP,
+    DHCP_START,
+    DHCP_END,
+];
 
 /// XML template processor for OPNsense configurations
 pub struct XmlTemplate {
     base_content: String,
+    /// Placeholders present in `base_content`, scanned once at construction
+    placeholders: Vec<&'static str>,
 }
 
 impl XmlTemplate {
@@ -21,7 +56,16 @@ pub fn new(base_content: String) -> Result<Self> {
             ));
         }
 
-        Ok(Self { base_content })
+        let placeholders = PLACEHOLDERS
+            .iter()
+            .copied()
+            .filter(|placeholder| base_content.contains(placeholder))
+            .collect();
+
+        Ok(Self {
+            base_content,
+            placeholders,
+        })
     }
 
     /// Apply a VLAN configuration to generate an XML configuration
@@ -35,30 +79,59 @@ pub fn apply_configuration(
         // In the full implementation, this would use the OPNsense XML generation
         // logic from the Python version, adapted to Rust
 
-        let mut result = self.base_content.clone();
-
-        // Replace placeholder values — all user-derived values are XML-escaped
-        // to prevent XML injection (CWE-91) from crafted CSV input
-        result = result.replace("{{VLAN_ID}}", &config.vlan_id.to_string());
-        result = result.replace("{{IP_NETWORK}}", &escape_xml_string(&config.ip_network));
-        result = result.replace("{{DESCRIPTION}}", &escape_xml_string(&config.description));
-        result = result.replace("{{WAN_ASSIGNMENT}}", &config.wan_assignment.to_string());
-        result = result.replace("{{FIREWALL_NR}}", &firewall_nr.to_string());
-        result = result.replace("{{OPT_COUNTER}}", &opt_counter.to_string());
+        // Render each value the template uses once. All user-derived values are
+        // XML-escaped to prevent XML injection (CWE-91) from crafted CSV input;
+        // placeholders whose value cannot be derived are left in place.
+        // The derived addresses share one prefix lookup, made only when used
+        let hosts = self
+            .placeholders
+            .iter()
+            .any(|placeholder| matches!(*placeholder, GATEWAY_IP | DHCP_START | DHCP_END))
+            .then(|| config.host_addresses().ok())
+            .flatten();
 
-        // Add gateway IP if possible
-        if let Ok(gateway) = config.gateway_ip() {
-            result = result.replace("{{GATEWAY_IP}}", &escape_xml_string(&gateway));
+        let mut values: Vec<(&'static str, Cow<'_, str>)> =
+            Vec::with_capacity(self.placeholders.len());
+        for &placeholder in &self.placeholders {
+            let value = match placeholder {
+                VLAN_ID => Some(Cow::Owned(config.vlan_id.to_string())),
+                IP_NETWORK => Some(escape_xml(&config.ip_network)),
+                DESCRIPTION => Some(escape_xml(&config.description)),
+                WAN_ASSIGNMENT => Some(Cow::Owned(config.wan_assignment.to_string())),
+                FIREWALL_NR => Some(Cow::Owned(firewall_nr.to_string())),
+                OPT_COUNTER => Some(Cow::Owned(opt_counter.to_string())),
+                GATEWAY_IP => hosts.as_ref().map(|hosts| escape_xml(&hosts.gateway)),
+                DHCP_START => hosts.as_ref().map(|hosts| escape_xml(&hosts.dhcp_start)),
+                DHCP_END => hosts.as_ref().map(|hosts| escape_xml(&hosts.dhcp_end)),
+                _ => None,
+            };
+            if let Some(value) = value {
+                values.push((placeholder, value));
+            }
         }
 
-        // Add DHCP range if possible
-        if let Ok(dhcp_start) = config.dhcp_range_start() {
-            result = result.replace("{{DHCP_START}}", &escape_xml_string(&dhcp_start));
-        }
-
-        if let Ok(dhcp_end) = config.dhcp_range_end() {
-            result = result.replace("{{DHCP_END}}", &escape_xml_string(&dhcp_end));
+        // Copy the template in a single pass, splicing values in at each
+        // placeholder instead of rescanning the whole document per placeholder
+        let mut result = String::with_capacity(self.base_content.len() + 256);
+        let mut rest = self.base_content.as_str();
+        while let Some(start) = rest.find("{{") {
+            result.push_str(&rest[..start]);
+            rest = &rest[start..];
+            match values
+                .iter()
+                .find(|(placeholder, _)| rest.starts_with(placeholder))
+            {
+                Some((placeholder, value)) => {
+                    result.push_str(value);
+                    rest = &rest[placeholder.len()..];
+                }
+                None => {
+                    result.push('{');
+                    rest = &rest[1..];
+                }
+            }
         }
+        result.push_str(rest);
 
         Ok(result)
     }
@@ -69,26 +142,57 @@ pub fn apply_configuration(
 /// Single-pass implementation: iterates the input once, avoiding 12 intermediate
 /// String allocations from chained `.replace()` calls.
 pub fn escape_xml_string(input: &str) -> String {
+    escape_xml(input).into_owned()
+}
+
+/// Escape XML special characters, borrowing the input when nothing changes
+///
+/// Generated descriptions, networks and addresses rarely need rewriting, so
+/// the common case is a scan with no allocation.
+pub(crate) fn escape_xml(input: &str) -> Cow<'_, str> {
+    let Some(first) = input.find(needs_escape) else {
+        return Cow::Borrowed(input);
+    };
+
+    // Copy each run of untouched text in one go and only splice in the
+    // replacements, instead of pushing the rest of the input char by char
     let mut result = String::with_capacity(input.len() + 20);
-    for ch in input.chars() {
-        match ch {
-            '&' => result.push_str("&amp;"),
-            '<' => result.push_str("&lt;"),
-            '>' => result.push_str("&gt;"),
-            '"' => result.push_str("&quot;"),
-            '\'' => result.push_str("&apos;"),
-            // Handle German umlauts as in Python version
-            'ä' => result.push_str("ae"),
-            'ö' => result.push_str("oe"),
-            'ü' => result.push_str("ue"),
-            'Ä' => result.push_str("Ae"),
-            'Ö' => result.push_str("Oe"),
-            'Ü' => result.push_str("Ue"),
-            'ß' => result.push_str("ss"),
-            _ => result.push(ch),
+    let mut copied = 0;
+    for (index, ch) in input[first..].char_indices() {
+        if let Some(replacement) = xml_replacement(ch) {
+            let index = first + index;
+            result.push_str(&input[copied..index]);
+            result.push_str(replacement);
+            copied = index + ch.len_utf8();
         }
     }
-    result
+    result.push_str(&input[copied..]);
+    Cow::Owned(result)
+}
+
+/// Replacement text for a character [`escape_xml`] rewrites
+fn xml_replacement(ch: char) -> Option<&'static str> {
+    Some(match ch {
+        '&' => "&amp;",
+        '<' => "&lt;",
+        '>' => "&gt;",
+        '"' => "&quot;",
+        '\'' => "&apos;",
+        // Handle German umlauts as in Python version
+        'ä' => "ae",
+        'ö' => "oe",
+        'ü' => "ue",
+        'Ä' => "Ae",
+        'Ö' => "Oe",
+        'Ü' => "Ue",
+        'ß' => "ss",
+        _ => return None,
+    })
+}
+
+/// Whether [`escape_xml`] rewrites this character
+fn needs_escape(ch: char) -> bool {
+    xml_replacement(ch).is_some()
 }
 
 #[cfg(test)]
@@ -104,6 +208,7 @@ fn test_xml_template_creation() {
 
         let template = XmlTemplate::new(xml_content.to_string()).unwrap();
         assert!(!template.base_content.is_empty());
+        assert_eq!(template.placeholders, vec![VLAN_ID, DESCRIPTION]);
     }
 
     #[test]
@@ -133,6 +238,32 @@ fn test_apply_configuration() {
         assert!(result.contains("<gateway>10.1.2.1</gateway>"));
     }
 
+    #[test]
+    fn test_apply_configuration_single_pass() {
+        let xml_content = r#"<?xml version="1.0"?>
+<opnsense>
+    <vlan id="{{VLAN_ID}}" opt="{{OPT_COUNTER}}">{{{VLAN_ID}}}</vlan>
+    <descr>{{DESCRIPTION}}</descr>
+    <other>{{UNKNOWN}}</other>
+</opnsense>"#;
+
+        let template = XmlTemplate::new(xml_content.to_string()).unwrap();
+        let config = VlanConfig::new(
+            100,
+            "10.1.2.x".to_string(),
+            "R&D {{VLAN_ID}}".to_string(),
+            1,
+        )
+        .unwrap();
+
+        let result = template.apply_configuration(&config, 1, 6).unwrap();
+
+        assert!(result.contains(r#"<vlan id="100" opt="6">{100}</vlan>"#));
+        // Values are not themselves scanned for placeholders
+        assert!(result.contains("<descr>R&amp;D {{VLAN_ID}}</descr>"));
+        assert!(result.contains("<other>{{UNKNOWN}}</other>"));
+    }
+
     #[test]
     fn test_escape_xml_string() {
         assert_eq!(escape_xml_string("Hello & World"), "Hello &amp; World");
@@ -140,5 +271,15 @@ fn test_escape_xml_string() {
         assert_eq!(escape_xml_string("\"quoted\""), "&quot;quoted&quot;");
         assert_eq!(escape_xml_string("Größe"), "Groesse");
         assert_eq!(escape_xml_string("Mädchen"), "Maedchen");
+        assert_eq!(
+            escape_xml_string("Über <Größe> ß'x"),
+            "Ueber &lt;Groesse&gt; ss&apos;x"
+        );
+    }
+
+    #[test]
+    fn test_escape_xml_borrows_clean_input() {
+        assert!(matches!(escape_xml("Sales VLAN 100"), Cow::Borrowed(_)));
+        assert_eq!(escape_xml("R&D VLAN"), "R&amp;D VLAN");
     }
 }
@@ -9,6 +9,7 @@
 use std::collections::HashMap;
 use std::ffi::OsStr;
 use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 use tempfile::TempDir;
 
 /// Test result with captured stdout and stderr
@@ -173,87 +174,39 @@ pub fn into_command(mut self) -> Command {
 /// assert_eq!(clean, "✅ Success Multiple spaces");
 /// ```
 pub fn normalize_output(text: &str) -> String {
+    let patterns = output_patterns();
+
     // Remove ANSI escape sequences
-    let ansi_regex = Regex::new(r"\x1b\[[0-9;]*[mGKHF]").unwrap();
-    let without_ansi = ansi_regex.replace_all(text, "");
+    let without_ansi = patterns.ansi.replace_all(text, "");
 
     // Remove other terminal control sequences
-    let control_regex =
-        Regex::new(r"\x1b[\[\]()#;?]*(?:[0-9]{1,4}(?:;[0-9]{0,4})*)?[0-9A-ORZcf-nqry=><~]")
-            .unwrap();
-    let without_control = control_regex.replace_all(&without_ansi, "");
+    let without_control = patterns.control.replace_all(&without_ansi, "");
 
     // Remove progress indicators and spinner characters
-    let progress_regex = Regex::new(r"[⠁⠂⠄⡀⢀⠠⠐⠈⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏▪▫]").unwrap();
-    let without_progress = progress_regex.replace_all(&without_control, "");
+    let without_progress = patterns.progress.replace_all(&without_control, "");
 
     // Normalize temporary file paths to stable placeholders
-    // Handle various temp directory patterns across different OS
     // NOTE: File patterns (with extensions) MUST be applied before directory patterns
     // to prevent greedy dir patterns from matching file paths first.
-    let temp_path_patterns = vec![
-        // macOS temp paths
-        r"/var/folders/[^/]+/[^/]+/T/[^\s]+\.(csv|xml|txt)",
-        // Linux temp paths
-        r"/tmp/[^\s]+\.(csv|xml|txt)",
-        // Windows temp paths - allow multiple path segments before Temp
-        r"[A-Z]:[^:\s]*\\[Tt]emp[^:\s]*\.(csv|xml|txt)",
-        r"[A-Z]:[^:\s]*\\AppData\\Local\\Temp[^:\s]*\.(csv|xml|txt)",
-        // Generic temp paths
-        r"/(?:var/folders|tmp|temp)/[^\s]+\.(csv|xml|txt)",
-    ];
-
-    // Also handle Windows paths with forward slashes (for cross-platform compatibility)
-    let windows_forward_slash_patterns = vec![
-        r"[A-Z]:/[^/]*/[Tt]emp[^/]*/[^\s]+\.(csv|xml|txt)",
-        r"[A-Z]:/[^/]*/AppData/Local/Temp/[^\s]+\.(csv|xml|txt)",
-    ];
-
     let mut with_normalized_paths = without_progress.to_string();
-    for pattern in temp_path_patterns {
-        if let Ok(regex) = Regex::new(pattern) {
-            with_normalized_paths = regex
-                .replace_all(&with_normalized_paths, "<TEMP_FILE>")
-                .into_owned();
-        }
-    }
-
-    // Process Windows forward slash patterns
-    for pattern in windows_forward_slash_patterns {
-        if let Ok(regex) = Regex::new(pattern) {
-            with_normalized_paths = regex
-                .replace_all(&with_normalized_paths, "<TEMP_FILE>")
-                .into_owned();
-        }
+    for regex in &patterns.temp_paths {
+        with_normalized_paths = regex
+            .replace_all(&with_normalized_paths, "<TEMP_FILE>")
+            .into_owned();
     }
 
     // Also normalize just the filename parts for cases where only filename is shown
     // But only if they haven't already been normalized as full paths
-    let temp_file_pattern = r"\b[a-zA-Z_][a-zA-Z0-9_]*_[A-Za-z0-9]{6,}\.(csv|xml|txt)\b";
-    let temp_file_regex = Regex::new(temp_file_pattern).unwrap();
-    let with_normalized_filenames =
-        temp_file_regex.replace_all(&with_normalized_paths, "<TEMP_FILE>");
+    let with_normalized_filenames = patterns
+        .temp_file
+        .replace_all(&with_normalized_paths, "<TEMP_FILE>");
 
     // Normalize temporary directory paths to stable placeholders
-    let temp_dir_patterns = vec![
-        // macOS temp directories
-        r"/var/folders/[^/]+/[^/]+/T/[^\s]*",
-        // Linux temp directories
-        r"/tmp/[^\s]*",
-        // Windows temp directories (with multiple path levels)
-        r"[A-Z]:[^:\s]*\\[Tt]emp[^:\s]*",
-        r"[A-Z]:[^:\s]*\\AppData\\Local\\Temp[^:\s]*",
-        // Generic temp directories
-        r"/(?:var/folders|tmp|temp)/[^\s]*",
-    ];
-
     let mut with_normalized_dirs = with_normalized_filenames.into_owned();
-    for pattern in temp_dir_patterns {
-        if let Ok(regex) = Regex::new(pattern) {
-            with_normalized_dirs = regex
-                .replace_all(&with_normalized_dirs, "<TEMP_DIR>")
-                .into_owned();
-        }
+    for regex in &patterns.temp_dirs {
+        with_normalized_dirs = regex
+            .replace_all(&with_normalized_dirs, "<TEMP_DIR>")
+            .into_owned();
     }
 
     // Normalize Windows .exe suffix in binary names for cross-platform snapshot stability
@@ -261,13 +214,76 @@ pub fn normalize_output(text: &str) -> String {
         with_normalized_dirs.replace("opnsense-config-faker.exe", "opnsense-config-faker");
 
     // Normalize whitespace
-    let whitespace_regex = Regex::new(r"\s+").unwrap();
-    let normalized = whitespace_regex.replace_all(&with_normalized_exe, " ");
+    let normalized = patterns.whitespace.replace_all(&with_normalized_exe, " ");
 
     // Trim and return
     normalized.trim().to_string()
 }
 
+/// Compiled patterns used by [`normalize_output`]
+struct OutputPatterns {
+    ansi: Regex,
+    control: Regex,
+    progress: Regex,
+    temp_paths: Vec<Regex>,
+    temp_file: Regex,
+    temp_dirs: Vec<Regex>,
+    whitespace: Regex,
+}
+
+/// Patterns for [`normalize_output`], compiled once and shared by every test
+/// in the binary instead of being rebuilt on each call
+fn output_patterns() -> &'static OutputPatterns {
+    static PATTERNS: OnceLock<OutputPatterns> = OnceLock::new();
+    PATTERNS.get_or_init(|| {
+        // Patterns that fail to compile are skipped rather than aborting the run
+        let compile_all = |patterns: &[&str]| -> Vec<Regex> {
+            patterns
+                .iter()
+                .filter_map(|pattern| Regex::new(pattern).ok())
+                .collect()
+        };
+
+        OutputPatterns {
+            ansi: Regex::new(r"\x1b\[[0-9;]*[mGKHF]").unwrap(),
+            control: Regex::new(
+                r"\x1b[\[\]()#;?]*(?:[0-9]{1,4}(?:;[0-9]{0,4})*)?[0-9A-ORZcf-nqry=><~]",
+            )
+            .unwrap(),
+            progress: Regex::new(r"[⠁⠂⠄⡀⢀⠠⠐⠈⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏▪▫]").unwrap(),
+            // Handle various temp directory patterns across different OS
+            temp_paths: compile_all(&[
+                // macOS temp paths
+                r"/var/folders/[^/]+/[^/]+/T/[^\s]+\.(csv|xml|txt)",
+                // Linux temp paths
+                r"/tmp/[^\s]+\.(csv|xml|txt)",
+                // Windows temp paths - allow multiple path segments before Temp
+                r"[A-Z]:[^:\s]*\\[Tt]emp[^:\s]*\.(csv|xml|txt)",
+                r"[A-Z]:[^:\s]*\\AppData\\Local\\Temp[^:\s]*\.(csv|xml|txt)",
+                // Generic temp paths
+                r"/(?:var/folders|tmp|temp)/[^\s]+\.(csv|xml|txt)",
+                // Windows paths with forward slashes (for cross-platform compatibility)
+                r"[A-Z]:/[^/]*/[Tt]emp[^/]*/[^\s]+\.(csv|xml|txt)",
+                r"[A-Z]:/[^/]*/AppData/Local/Temp/[^\s]+\.(csv|xml|txt)",
+            ]),
+            temp_file: Regex::new(r"\b[a-zA-Z_][a-zA-Z0-9_]*_[A-Za-z0-9]{6,}\.(csv|xml|txt)\b")
+                .unwrap(),
+            temp_dirs: compile_all(&[
+                // macOS temp directories
+                r"/var/folders/[^/]+/[^/]+/T/[^\s]*",
+                // Linux temp directories
+                r"/tmp/[^\s]*",
+                // Windows temp directories (with multiple path levels)
+                r"[A-Z]:[^:\s]*\\[Tt]emp[^:\s]*",
+                r"[A-Z]:[^:\s]*\\AppData\\Local\\Temp[^:\s]*",
+                // Generic temp directories
+                r"/(?:var/folders|tmp|temp)/[^\s]*",
+            ]),
+            whitespace: Regex::new(r"\s+").unwrap(),
+        }
+    })
+}
+
 /// Create a temporary directory using tempfile for basic temp needs
 ///
 /// # Example
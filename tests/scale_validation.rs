@@ -4,6 +4,7 @@
 
 use opnsense_config_faker::generator::vlan::VlanGenerator;
 use opnsense_config_faker::io::csv;
+use std::collections::HashSet;
 use std::time::Instant;
 use tempfile::NamedTempFile;
 
@@ -42,9 +43,8 @@ fn test_scale_validation_comprehensive() {
         assert_eq!(vlan_ids.len(), configs.len(), "VLAN IDs should be unique");
 
         // Check for unique networks
-        let mut networks: Vec<String> = configs.iter().map(|c| c.ip_network.clone()).collect();
-        networks.sort();
-        networks.dedup();
+        // Hash borrowed strings instead of cloning and sorting every network
+        let networks: HashSet<&str> = configs.iter().map(|c| c.ip_network.as_str()).collect();
         assert_eq!(networks.len(), configs.len(), "Networks should be unique");
 
         println!(